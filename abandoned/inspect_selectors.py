@@ -4,147 +4,206 @@ This script opens the store websites in a visible browser and takes screenshots
 to help identify the correct CSS selectors for scraping.
 """
 
+import argparse
 from playwright.sync_api import sync_playwright
 import time
 
+# Banner string reused by every run instead of rebuilt per print
+EQ = "=" * 60
+
+# Candidate product selectors probed on every inspected page
+COMMON_SELECTORS = [
+    "div.product",
+    "div[class*='product']",
+    "article.product",
+    "article[class*='product']",
+    "div.item",
+    "div[class*='item']",
+    "div[class*='tile']",
+    "div[class*='card']",
+    "li[class*='product']",
+    "a[class*='product']",
+]
+
+# Class-name fragments that usually mark product elements
+PRODUCT_CLASS_KEYS = ["product", "item", "tile", "card", "special"]
+
+# Walk the DOM once with a TreeWalker and stop as soon as enough unique
+# matching classes are collected, instead of materializing every element
+# via querySelectorAll('*')
+CLASS_SCAN_JS = """
+    ({ keys, limit }) => {
+        const walker = document.createTreeWalker(
+            document.body, NodeFilter.SHOW_ELEMENT);
+        const classes = new Set();
+        let node;
+        while ((node = walker.nextNode()) && classes.size < limit) {
+            for (const cls of node.classList) {
+                const lower = cls.toLowerCase();
+                if (keys.some((key) => lower.includes(key))) {
+                    classes.add(cls);
+                }
+            }
+        }
+        return Array.from(classes).slice(0, limit);
+    }
+"""
+
+# Probe all candidate selectors in one in-page pass instead of one
+# query_selector_all round-trip per selector
+SELECTOR_PROBE_JS = """
+    (selectors) => selectors.map((selector) => {
+        const nodes = document.querySelectorAll(selector);
+        return {
+            selector,
+            count: nodes.length,
+            sample: nodes[0] ? (nodes[0].innerText || '').slice(0, 100) : '',
+        };
+    })
+"""
+
+
+def inspect_website(browser, name: str, url: str, full_page: bool = False) -> None:
+    """Open a website in the shared browser and help identify selectors.
 
-def inspect_website(name: str, url: str) -> None:
-    """Open a website and help identify selectors.
-    
     Args:
+        browser: Shared Playwright browser instance
         name: Store name
         url: URL to inspect
+        full_page: Capture the entire scrollable page instead of the viewport
     """
-    print(f"\n{'='*60}")
+    print(f"\n{EQ}")
     print(f"Inspecting: {name}")
     print(f"URL: {url}")
-    print(f"{'='*60}\n")
-    
-    with sync_playwright() as p:
-        # Launch browser in headed mode (visible)
-        browser = p.chromium.launch(headless=False)
-        page = browser.new_page()
-        
-        print("Loading page...")
-        try:
-            page.goto(url, timeout=60000)
-            print("✓ Page loaded successfully")
-            
-            # Wait for page to settle
-            page.wait_for_load_state("networkidle", timeout=30000)
-            print("✓ Network idle")
-            
-            # Take a screenshot
-            screenshot_name = f"{name.lower().replace(' ', '_')}_screenshot.png"
+    print(f"{EQ}\n")
+
+    # Fresh context per site keeps cookies isolated without paying a full
+    # Chromium cold start for every store
+    context = browser.new_context()
+    page = context.new_page()
+
+    print("Loading page...")
+    try:
+        page.goto(url, timeout=60000)
+        print("✓ Page loaded successfully")
+
+        # Wait for the first common product selector rather than
+        # networkidle, which tracker beacons can keep from ever settling
+        for selector in COMMON_SELECTORS:
+            try:
+                page.wait_for_selector(selector, timeout=3000)
+                print(f"✓ Content visible ({selector})")
+                break
+            except Exception:
+                continue
+
+        # Take a screenshot. The default viewport JPEG is much faster than
+        # PNG-encoding the entire scrollable page on tall catalogue pages.
+        base_name = name.lower().replace(' ', '_')
+        if full_page:
+            screenshot_name = f"{base_name}_screenshot.png"
             page.screenshot(path=screenshot_name, full_page=True)
-            print(f"✓ Screenshot saved: {screenshot_name}")
-            
-            # Try to find common product selectors
-            print("\nSearching for common selectors...")
-            common_selectors = [
-                "div.product",
-                "div[class*='product']",
-                "article.product",
-                "article[class*='product']",
-                "div.item",
-                "div[class*='item']",
-                "div[class*='tile']",
-                "div[class*='card']",
-                "li[class*='product']",
-                "a[class*='product']",
-            ]
-            
-            for selector in common_selectors:
-                elements = page.query_selector_all(selector)
-                if elements and len(elements) > 5:
-                    print(f"  ✓ Found {len(elements)} elements with: {selector}")
-                    # Get sample text from first element
-                    try:
-                        sample_text = elements[0].inner_text()[:100]
-                        print(f"    Sample: {sample_text}...")
-                    except:
-                        pass
-            
-            # Get page title
-            title = page.title()
-            print(f"\nPage title: {title}")
-            
-            # Check for common class names
-            print("\nLooking for product-related classes...")
-            all_classes = page.evaluate("""
-                () => {
-                    const elements = document.querySelectorAll('*');
-                    const classes = new Set();
-                    elements.forEach(el => {
-                        el.classList.forEach(cls => {
-                            if (cls.toLowerCase().includes('product') || 
-                                cls.toLowerCase().includes('item') ||
-                                cls.toLowerCase().includes('tile') ||
-                                cls.toLowerCase().includes('card') ||
-                                cls.toLowerCase().includes('special')) {
-                                classes.add(cls);
-                            }
-                        });
-                    });
-                    return Array.from(classes).slice(0, 20);
-                }
-            """)
-            
-            if all_classes:
-                print("  Relevant classes found:")
-                for cls in all_classes[:10]:
-                    print(f"    - {cls}")
-            
-            print(f"\n{'='*60}")
-            print("Browser will stay open for 30 seconds for manual inspection.")
-            print("You can use browser DevTools (F12) to inspect elements.")
-            print(f"{'='*60}\n")
-            
-            # Keep browser open for inspection
-            time.sleep(30)
-            
-        except Exception as e:
-            print(f"✗ Error: {e}")
-        finally:
-            browser.close()
+        else:
+            screenshot_name = f"{base_name}_screenshot.jpg"
+            page.screenshot(
+                path=screenshot_name,
+                full_page=False,
+                type="jpeg",
+                quality=70,
+            )
+        print(f"✓ Screenshot saved: {screenshot_name}")
+
+        # Try to find common product selectors
+        print("\nSearching for common selectors...")
+        probe_results = page.evaluate(SELECTOR_PROBE_JS, COMMON_SELECTORS)
+
+        for result in probe_results:
+            if result["count"] > 5:
+                print(f"  ✓ Found {result['count']} elements with: {result['selector']}")
+                if result["sample"]:
+                    print(f"    Sample: {result['sample']}...")
+
+        # Get page title
+        title = page.title()
+        print(f"\nPage title: {title}")
+
+        # Check for common class names
+        print("\nLooking for product-related classes...")
+        # Only 10 classes are ever displayed, so only 10 cross the wire
+        all_classes = page.evaluate(
+            CLASS_SCAN_JS,
+            {"keys": PRODUCT_CLASS_KEYS, "limit": 10},
+        )
+
+        if all_classes:
+            print("  Relevant classes found:")
+            for cls in all_classes:
+                print(f"    - {cls}")
+
+        print(f"\n{EQ}")
+        print("Browser will stay open for 30 seconds for manual inspection.")
+        print("You can use browser DevTools (F12) to inspect elements.")
+        print(f"{EQ}\n")
+
+        # Keep browser open for inspection
+        time.sleep(30)
+
+    except Exception as e:
+        print(f"✗ Error: {e}")
+    finally:
+        context.close()
 
 
 def main() -> None:
     """Inspect both store websites."""
+    parser = argparse.ArgumentParser(description="Inspect store websites for selectors.")
+    parser.add_argument(
+        "--full-page",
+        action="store_true",
+        help="Capture full-page PNG screenshots (slower) instead of viewport JPEGs.",
+    )
+    args = parser.parse_args()
+
     stores = [
         ("Coles Catalogues", "https://www.coles.com.au/catalogues-and-specials"),
         ("Woolworths Catalogue", "https://www.woolworths.com.au/shop/catalogue"),
     ]
     
-    print("="*60)
+    print(EQ)
     print("WEBSITE INSPECTOR - Finding Correct Selectors")
-    print("="*60)
+    print(EQ)
     print("\nThis tool will:")
     print("1. Open each website in a visible browser")
-    print("2. Take full-page screenshots")
+    print("2. Take screenshots (viewport by default, --full-page for everything)")
     print("3. Search for common product selectors")
     print("4. Keep browser open for 30 seconds for manual inspection")
     print("\nPress Ctrl+C to skip to the next website.")
-    print("="*60)
+    print(EQ)
     
     input("\nPress Enter to start inspection...")
-    
-    for name, url in stores:
+
+    # Launch one browser for the whole run; each site gets its own context
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=False)
         try:
-            inspect_website(name, url)
-        except KeyboardInterrupt:
-            print("\n\nSkipping to next website...")
-            continue
-    
-    print("\n" + "="*60)
+            for name, url in stores:
+                try:
+                    inspect_website(browser, name, url, full_page=args.full_page)
+                except KeyboardInterrupt:
+                    print("\n\nSkipping to next website...")
+                    continue
+        finally:
+            browser.close()
+
+    print("\n" + EQ)
     print("INSPECTION COMPLETE")
-    print("="*60)
+    print(EQ)
     print("\nNext steps:")
     print("1. Review the screenshots saved in this directory")
     print("2. Use the suggested selectors found above")
     print("3. Update the STORES configuration in src/main.py")
     print("4. Run: python -m src.main --scrape-test")
-    print("="*60 + "\n")
+    print(EQ + "\n")
 
 
 if __name__ == "__main__":
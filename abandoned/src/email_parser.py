@@ -15,15 +15,25 @@ Environment Variables:
     EMAIL_PASS: Your email password or app-specific password
 """
 
+import base64
 import imaplib
 import email
+import email.message
 from email.header import decode_header
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.etree
+import lxml.html
 import os
-from typing import List, Dict, Tuple
+import quopri
+import shelve
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 import re
 
+from src.matching import AHOCORASICK_AVAILABLE, build_automaton, build_pattern
+
 
 # Email configuration
 IMAP_SERVER = os.getenv("EMAIL_IMAP_SERVER", "imap.gmail.com")
@@ -31,59 +41,340 @@ IMAP_PORT = int(os.getenv("EMAIL_IMAP_PORT", "993"))
 EMAIL_USER = os.getenv("EMAIL_USER", "")
 EMAIL_PASS = os.getenv("EMAIL_PASS", "")
 
+# How many messages to request per FETCH command. Batching amortizes the
+# server round-trip, but a run processes at most 20 messages, so the
+# batch must be well under that for the prefetch thread to have a next
+# batch to overlap with parsing; 8 gives up to three pipelined batches.
+FETCH_BATCH_SIZE = 8
+
+# Parts larger than this are pulled in ranged BODY.PEEK[..]<start.size>
+# chunks rather than one giant literal
+FETCH_CHUNK_KB = int(os.getenv("EMAIL_FETCH_CHUNK_KB", "256"))
+
+# imaplib's default 10KB line limit chokes on large FETCH responses from
+# image-heavy newsletters; raise it once at import
+imaplib._MAXLINE = max(imaplib._MAXLINE, 10 * 1024 * 1024)
+
+# On-disk cache of parsed emails keyed by UID; a message whose
+# INTERNALDATE is unchanged is served from here without a body fetch
+EMAIL_CACHE_FILE = "email_cache.db"
+
 # Store email addresses to monitor
 STORE_EMAILS = {
     "Coles": ["coles@coles.com.au", "noreply@coles.com.au", "catalogue@coles.com.au"],
     "Woolworths": ["woolworths@woolworths.com.au", "noreply@woolworths.com.au"],
 }
 
+# Compiled once at import instead of on every parsed email
+_PRICE_RE = re.compile(r'\$\d+(?:\.\d{2})?')
+_WHITESPACE_RE = re.compile(r'[ \t]*\n[ \t\n]*|[ \t]{2,}')
+_UID_RE = re.compile(r'UID (\d+)')
+_INTERNALDATE_RE = re.compile(r'INTERNALDATE "([^"]+)"')
+
+# Class-name fragments that usually mark product containers
+_CLASS_SUBSTRINGS = ('product', 'item', 'special', 'offer')
+
+
+def _looks_like_product_class(value: Optional[str]) -> bool:
+    """Class-attribute predicate for the strainer.
+
+    Plain substring checks short-circuit on the first hit, which beats
+    running a compiled regex against the class of every tag in the tree.
+    """
+    return bool(value) and any(s in value.lower() for s in _CLASS_SUBSTRINGS)
+
+# Only parse the product-looking subtrees; most newsletter HTML is
+# layout tables and tracking pixels the parser can skip entirely
+_PRODUCT_STRAINER = SoupStrainer(['div', 'td', 'p'], class_=_looks_like_product_class)
+
+
+# Cached IMAP connection, reused across check_newsletters calls so each
+# poll doesn't pay a fresh TLS handshake + LOGIN round-trip
+_MAIL_SINGLETON: Optional[imaplib.IMAP4_SSL] = None
+_MAIL_LOCK = threading.Lock()
+
 
 def connect_to_email() -> imaplib.IMAP4_SSL:
-    """Connect to email server via IMAP.
-    
+    """Connect to email server via IMAP, reusing the cached connection.
+
     Returns:
-        IMAP connection object
-        
+        IMAP connection object (cached if still alive, else fresh login)
+
     Raises:
         Exception: If connection fails
     """
-    try:
-        mail = imaplib.IMAP4_SSL(IMAP_SERVER, IMAP_PORT)
-        mail.login(EMAIL_USER, EMAIL_PASS)
+    global _MAIL_SINGLETON
+    with _MAIL_LOCK:
+        if _MAIL_SINGLETON is not None:
+            try:
+                status, _ = _MAIL_SINGLETON.noop()
+                if status == "OK":
+                    return _MAIL_SINGLETON
+            except Exception:
+                pass  # Stale socket; fall through and reconnect
+            _MAIL_SINGLETON = None
+        try:
+            mail = imaplib.IMAP4_SSL(IMAP_SERVER, IMAP_PORT)
+            mail.login(EMAIL_USER, EMAIL_PASS)
+        except Exception as e:
+            raise Exception(f"Failed to connect to email: {e}")
+        _MAIL_SINGLETON = mail
         return mail
-    except Exception as e:
-        raise Exception(f"Failed to connect to email: {e}")
 
 
-def get_recent_emails(mail: imaplib.IMAP4_SSL, days: int = 7) -> List[Tuple[str, bytes]]:
-    """Fetch recent emails from store newsletters.
-    
+def close_email_connection() -> None:
+    """Log out and drop the cached IMAP connection.
+
+    Call this at process shutdown or from tests; normal polling leaves
+    the connection warm for the next run.
+    """
+    global _MAIL_SINGLETON
+    with _MAIL_LOCK:
+        if _MAIL_SINGLETON is not None:
+            try:
+                _MAIL_SINGLETON.logout()
+            except Exception:
+                pass
+            _MAIL_SINGLETON = None
+
+
+def _build_or_query(addresses: List[str]) -> str:
+    """Build a nested IMAP OR search term over sender addresses.
+
+    IMAP's OR takes exactly two arguments, so multiple addresses nest:
+    OR FROM "a" (OR FROM "b" FROM "c").
+
+    Args:
+        addresses: Sender addresses to combine
+
+    Returns:
+        Search term string matching any of the addresses
+    """
+    query = f'FROM "{addresses[-1]}"'
+    for address in reversed(addresses[:-1]):
+        query = f'OR FROM "{address}" {query}'
+    return query
+
+
+def get_recent_emails(mail: imaplib.IMAP4_SSL, days: int = 7) -> List[bytes]:
+    """Find recent emails from store newsletters.
+
     Args:
         mail: IMAP connection object
         days: Number of days to look back
-        
+
     Returns:
-        List of (email_id, email_data) tuples
+        List of message UIDs. UIDs (unlike sequence numbers) stay stable
+        across sessions, which is what lets the parse cache work.
     """
     mail.select('inbox')
-    
+
     # Calculate date threshold
     date_threshold = (datetime.now() - timedelta(days=days)).strftime("%d-%b-%Y")
-    
-    # Build search query for all store emails
-    all_emails = []
-    for store, addresses in STORE_EMAILS.items():
-        for address in addresses:
-            try:
-                status, messages = mail.search(None, f'(FROM "{address}" SINCE {date_threshold})')
-                if status == "OK" and messages[0]:
-                    email_ids = messages[0].split()
-                    print(f"  Found {len(email_ids)} emails from {store} ({address})")
-                    all_emails.extend(email_ids)
-            except Exception as e:
-                print(f"  Warning: Could not search emails from {address}: {e}")
-    
-    return all_emails
+
+    # One OR-combined search covers every store address in a single
+    # round-trip instead of one SEARCH command per address
+    addresses = [addr for addrs in STORE_EMAILS.values() for addr in addrs]
+    query = f'({_build_or_query(addresses)} SINCE {date_threshold})'
+    try:
+        status, messages = mail.uid('SEARCH', None, query)
+    except Exception as e:
+        print(f"  Warning: Could not search store emails: {e}")
+        return []
+
+    if status != "OK" or not messages[0]:
+        return []
+
+    email_ids = messages[0].split()
+    print(f"  Found {len(email_ids)} emails across {len(addresses)} store addresses")
+    return email_ids
+
+
+def _parse_imap_list(text: str, pos: int = 0) -> Tuple[list, int]:
+    """Parse one parenthesized IMAP list (e.g. a BODYSTRUCTURE response).
+
+    Args:
+        text: Response text starting with '(' at pos
+        pos: Index of the opening parenthesis
+
+    Returns:
+        (items, position after the closing parenthesis) tuple
+    """
+    pos += 1  # skip '('
+    items = []
+    while pos < len(text):
+        ch = text[pos]
+        if ch == '(':
+            sub, pos = _parse_imap_list(text, pos)
+            items.append(sub)
+        elif ch == ')':
+            return items, pos + 1
+        elif ch == '"':
+            end = text.index('"', pos + 1)
+            items.append(text[pos + 1:end])
+            pos = end + 1
+        elif ch == ' ':
+            pos += 1
+        else:
+            end = pos
+            while end < len(text) and text[end] not in ' ()':
+                end += 1
+            items.append(text[pos:end])
+            pos = end
+    return items, pos
+
+
+def _find_html_section(part: list, prefix: str = "") -> Optional[Tuple[str, str, int]]:
+    """Locate the text/html part in a parsed BODYSTRUCTURE.
+
+    Args:
+        part: Parsed BODYSTRUCTURE list (from _parse_imap_list)
+        prefix: Section-number prefix accumulated while recursing
+
+    Returns:
+        (section number like "1.2", content-transfer-encoding, size in
+        bytes) or None
+    """
+    if part and isinstance(part[0], list):
+        # Multipart: child parts come first, numbered 1..N at this level
+        index = 0
+        for child in part:
+            if not isinstance(child, list):
+                break
+            index += 1
+            found = _find_html_section(child, f"{prefix}{index}.")
+            if found:
+                return found
+        return None
+    if (
+        len(part) >= 2
+        and str(part[0]).lower() == "text"
+        and str(part[1]).lower() == "html"
+    ):
+        encoding = str(part[5]).lower() if len(part) > 5 else "7bit"
+        try:
+            size = int(part[6]) if len(part) > 6 else 0
+        except (TypeError, ValueError):
+            size = 0
+        return prefix.rstrip(".") or "1", encoding, size
+    return None
+
+
+def _decode_transfer_encoding(payload: bytes, encoding: str) -> bytes:
+    """Undo a part's content-transfer-encoding on raw fetched bytes."""
+    if encoding == "base64":
+        try:
+            return base64.b64decode(payload)
+        except Exception:
+            return payload
+    if encoding == "quoted-printable":
+        return quopri.decodestring(payload)
+    return payload
+
+
+def fetch_html_bodies(
+    mail: imaplib.IMAP4_SSL, email_ids: List[bytes]
+) -> List[Tuple[bytes, email.message.Message, Optional[bytes]]]:
+    """Fetch headers plus only the text/html MIME part of each message.
+
+    Marketing emails are dominated by inline images and attachments the
+    parser never reads, so instead of pulling full RFC822 bodies this asks
+    the server for the BODYSTRUCTURE, picks the HTML section number, and
+    fetches just that part (with BODY.PEEK so messages stay unread).
+
+    Args:
+        mail: IMAP connection object
+        email_ids: Message UIDs to fetch
+
+    Returns:
+        List of (UID, header-only message, decoded HTML bytes) tuples.
+        HTML bytes are None for messages where no text/html part was
+        found; those fall back to a full RFC822 fetch and carry a
+        complete message object instead.
+    """
+    headers: Dict[bytes, email.message.Message] = {}
+    sections: Dict[bytes, Tuple[str, str, int]] = {}
+
+    # Only the three headers the parser reads, not the full header block
+    status, msg_data = mail.uid(
+        'FETCH',
+        b','.join(email_ids),
+        '(BODY.PEEK[HEADER.FIELDS (SUBJECT FROM DATE)] BODYSTRUCTURE)',
+    )
+    if status != "OK":
+        return []
+
+    for item in msg_data:
+        if not isinstance(item, tuple):
+            continue
+        meta = item[0].decode('ascii', errors='ignore')
+        uid_match = _UID_RE.search(meta)
+        if not uid_match:
+            continue
+        msg_id = uid_match.group(1).encode()
+        headers[msg_id] = email.message_from_bytes(item[1])
+        start = meta.find('BODYSTRUCTURE')
+        if start != -1:
+            structure = meta[start + len('BODYSTRUCTURE'):].strip()
+            if structure.startswith('('):
+                parsed, _ = _parse_imap_list(structure)
+                found = _find_html_section(parsed)
+                if found:
+                    sections[msg_id] = found
+
+    # Batch the part fetches, grouping messages that share a section
+    # number. Oversized parts are streamed in ranged chunks instead so a
+    # single huge newsletter can't dominate one response.
+    chunk_size = FETCH_CHUNK_KB * 1024
+    bodies: Dict[bytes, bytes] = {}
+    by_section: Dict[str, List[bytes]] = {}
+    for msg_id, (section, encoding, size) in sections.items():
+        if size > chunk_size:
+            buf = bytearray()
+            while len(buf) < size:
+                status, msg_data = mail.uid(
+                    'FETCH', msg_id, f'(BODY.PEEK[{section}]<{len(buf)}.{chunk_size}>)'
+                )
+                if status != "OK":
+                    break
+                chunk = next(
+                    (item[1] for item in msg_data if isinstance(item, tuple)), b''
+                )
+                if not chunk:
+                    break
+                buf += chunk
+            bodies[msg_id] = _decode_transfer_encoding(bytes(buf), encoding)
+        else:
+            by_section.setdefault(section, []).append(msg_id)
+
+    for section, ids in by_section.items():
+        status, msg_data = mail.uid('FETCH', b','.join(ids), f'(BODY.PEEK[{section}])')
+        if status != "OK":
+            continue
+        for item in msg_data:
+            if not isinstance(item, tuple):
+                continue
+            uid_match = _UID_RE.search(item[0].decode('ascii', errors='ignore'))
+            if not uid_match:
+                continue
+            msg_id = uid_match.group(1).encode()
+            encoding = sections.get(msg_id, ("", "7bit", 0))[1]
+            bodies[msg_id] = _decode_transfer_encoding(item[1], encoding)
+
+    # Messages without a recognizable HTML part get the old full fetch
+    missing = [msg_id for msg_id in headers if msg_id not in bodies]
+    if missing:
+        status, msg_data = mail.uid('FETCH', b','.join(missing), '(RFC822)')
+        if status == "OK":
+            for item in msg_data:
+                if not isinstance(item, tuple):
+                    continue
+                uid_match = _UID_RE.search(item[0].decode('ascii', errors='ignore'))
+                if not uid_match:
+                    continue
+                headers[uid_match.group(1).encode()] = email.message_from_bytes(item[1])
+
+    return [(msg_id, headers[msg_id], bodies.get(msg_id)) for msg_id in headers]
 
 
 def decode_email_subject(subject: str) -> str:
@@ -114,29 +405,31 @@ def extract_text_from_html(html_content: str) -> str:
     Returns:
         Plain text content
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
+    # Go straight to lxml rather than wrapping the tree in BeautifulSoup:
+    # only the text is needed here and text_content() runs in C
+    tree = lxml.html.fromstring(html_content)
+
     # Remove script and style elements
-    for script in soup(["script", "style"]):
-        script.decompose()
-    
+    lxml.etree.strip_elements(tree, 'script', 'style', with_tail=False)
+
     # Get text
-    text = soup.get_text()
-    
-    # Clean up whitespace
-    lines = (line.strip() for line in text.splitlines())
-    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-    text = '\n'.join(chunk for chunk in chunks if chunk)
-    
-    return text
+    text = tree.text_content()
 
+    # Clean up whitespace in one C-level regex pass instead of three
+    # Python-level generator traversals
+    return _WHITESPACE_RE.sub('\n', text).strip()
 
-def parse_email_for_products(email_message: email.message.Message) -> Dict:
+
+def parse_email_for_products(
+    email_message: email.message.Message,
+    html_bytes: Optional[bytes] = None,
+) -> Dict:
     """Parse email and extract product information.
-    
+
     Args:
-        email_message: Email message object
-        
+        email_message: Email message object (may be header-only)
+        html_bytes: Pre-fetched HTML body, skipping the MIME-part walk
+
     Returns:
         Dictionary with email metadata and products
     """
@@ -145,18 +438,26 @@ def parse_email_for_products(email_message: email.message.Message) -> Dict:
     from_addr = email_message.get("From", "")
     date = email_message.get("Date", "")
     
-    # Determine store from sender
+    # Determine store from sender (lowercase once, not per address)
     store = "Unknown"
+    from_addr_lower = from_addr.lower()
     for store_name, addresses in STORE_EMAILS.items():
-        if any(addr in from_addr.lower() for addr in addresses):
+        if any(addr in from_addr_lower for addr in addresses):
             store = store_name
             break
     
-    products = []
+    # Insertion-ordered dict so duplicates are dropped as they arrive
+    # instead of rehashing the whole list at return
+    products = {}
     html_content = ""
-    
-    # Extract email body
-    if email_message.is_multipart():
+
+    # Extract email body; prefer the pre-fetched HTML part when available
+    if html_bytes is not None:
+        try:
+            html_content = html_bytes.decode('utf-8', errors='ignore')
+        except Exception:
+            html_content = html_bytes.decode('latin-1', errors='ignore')
+    elif email_message.is_multipart():
         for part in email_message.walk():
             content_type = part.get_content_type()
             if content_type == "text/html":
@@ -171,61 +472,67 @@ def parse_email_for_products(email_message: email.message.Message) -> Dict:
         except:
             html_content = email_message.get_payload(decode=True).decode('latin-1', errors='ignore')
     
-    # Parse HTML for products
+    # Parse HTML for products; lxml is roughly 10x faster than the
+    # pure-Python html.parser backend on real newsletter HTML
     if html_content:
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
         # Common patterns for product information
         # These patterns may need adjustment based on actual email structure
-        
-        # Look for price patterns (e.g., $5.99, $10)
-        price_pattern = re.compile(r'\$\d+(?:\.\d{2})?')
-        
-        # Try to find product containers
-        product_containers = soup.find_all(['div', 'td', 'p'], class_=re.compile(r'product|item|special|offer', re.I))
-        
-        for container in product_containers[:50]:  # Limit to first 50
+        soup = BeautifulSoup(html_content, 'lxml', parse_only=_PRODUCT_STRAINER)
+
+        for container in soup.find_all(True, recursive=False)[:50]:  # Limit to first 50
             text = container.get_text(strip=True)
             # Look for text with prices
-            if price_pattern.search(text) and len(text) > 10:
-                products.append(text)
+            if _PRICE_RE.search(text) and len(text) > 10:
+                products[text] = None
         
         # Fallback: extract all text and look for price patterns
         if not products:
             full_text = extract_text_from_html(html_content)
             lines = full_text.split('\n')
             for line in lines:
-                if price_pattern.search(line) and len(line.strip()) > 10:
-                    products.append(line.strip())
+                if _PRICE_RE.search(line) and len(line.strip()) > 10:
+                    products[line.strip()] = None
     
     return {
         "store": store,
         "subject": subject,
         "from": from_addr,
         "date": date,
-        "products": list(set(products[:100])),  # Remove duplicates, limit to 100
+        "products": list(products)[:100],  # Already deduplicated, limit to 100
         "product_count": len(products)
     }
 
 
 def find_matches(products: List[str], watchlist: List[str]) -> List[str]:
     """Find products matching the watchlist.
-    
+
     Args:
         products: List of product strings
         watchlist: List of keywords to match
-        
+
     Returns:
         List of matching products
     """
-    matches = []
-    for product in products:
-        lower_product = product.lower()
-        for term in watchlist:
-            if term.lower() in lower_product:
-                matches.append(product)
-                break
-    return matches
+    if not products or not watchlist:
+        return []
+
+    # Lowercase terms once and reuse the compiled matcher across every
+    # email scanned with the same watchlist
+    lower_terms = tuple(term.lower() for term in watchlist)
+
+    if AHOCORASICK_AVAILABLE:
+        # One automaton scans each product in a single linear pass instead
+        # of a substring search per watchlist term
+        automaton = build_automaton(lower_terms)
+        return [
+            product
+            for product in products
+            if next(automaton.iter(product.lower()), None) is not None
+        ]
+
+    # Fallback: a compiled alternation gives the same single-pass scan
+    pattern = build_pattern(lower_terms)
+    return [product for product in products if pattern.search(product)]
 
 
 def check_newsletters(watchlist: List[str], days: int = 7, verbose: bool = True) -> Dict[str, List[str]]:
@@ -261,45 +568,123 @@ def check_newsletters(watchlist: List[str], days: int = 7, verbose: bool = True)
         
         if not email_ids:
             print("No store emails found in the specified period.")
-            mail.logout()
-            return {}
+            return {}  # Leave the connection warm for the next poll
         
         # Process emails
         all_matches = {}
-        
-        for i, email_id in enumerate(email_ids[:20], 1):  # Process up to 20 most recent
-            if verbose:
-                print(f"Processing email {i}/{min(len(email_ids), 20)}...")
-            
-            # Fetch email
-            status, msg_data = mail.fetch(email_id, '(RFC822)')
-            if status != "OK":
-                continue
-            
-            # Parse email
-            email_message = email.message_from_bytes(msg_data[0][1])
-            parsed = parse_email_for_products(email_message)
-            
+        recent_ids = email_ids[:20]  # Process up to 20 most recent
+
+        # Probe INTERNALDATE for the whole set in one round-trip; a UID
+        # whose arrival time is unchanged refers to the exact same
+        # message, so cache hits skip both the body fetch and the parse
+        internal_dates: Dict[bytes, str] = {}
+        status, msg_data = mail.uid('FETCH', b','.join(recent_ids), '(INTERNALDATE)')
+        if status == "OK":
+            for item in msg_data:
+                meta = item[0] if isinstance(item, tuple) else item
+                if not meta:
+                    continue
+                meta = meta.decode('ascii', errors='ignore')
+                uid_match = _UID_RE.search(meta)
+                date_match = _INTERNALDATE_RE.search(meta)
+                if uid_match and date_match:
+                    internal_dates[uid_match.group(1).encode()] = date_match.group(1)
+
+        # A watchlist term that never appears in the raw HTML bytes can't
+        # appear in the parsed products either, so one linear byte scan
+        # lets us skip the whole BeautifulSoup pass for most newsletters
+        watchlist_bytes_re = re.compile(
+            b"|".join(re.escape(term.encode()) for term in watchlist), re.I
+        )
+
+        def scan_parsed(parsed: Dict) -> None:
+            """Match one parsed email against the watchlist."""
             if verbose:
                 print(f"  Store: {parsed['store']}")
                 print(f"  Subject: {parsed['subject'][:60]}...")
                 print(f"  Products found: {parsed['product_count']}")
-            
-            # Find matches
+
             matches = find_matches(parsed['products'], watchlist)
-            
+
             if matches:
                 store_name = f"{parsed['store']} - {parsed['subject'][:30]}"
                 all_matches[store_name] = matches
                 if verbose:
                     print(f"  ✓ Found {len(matches)} matching items!")
-            
+
             if verbose:
                 print()
+
+        i = 0
+        with shelve.open(EMAIL_CACHE_FILE) as cache:
+            # Serve unchanged messages straight from the parse cache
+            to_fetch = []
+            for uid in recent_ids:
+                entry = cache.get(uid.decode())
+                if entry is not None and entry.get("internaldate") == internal_dates.get(uid):
+                    i += 1
+                    if verbose:
+                        print(f"Processing email {i}/{len(recent_ids)} (cached)...")
+                    scan_parsed(entry["parsed"])
+                else:
+                    to_fetch.append(uid)
+
+            # Fetch the rest in batches: one FETCH with a comma-joined ID
+            # set costs a single server round-trip instead of one per
+            # message, and pulling headers + the HTML part only skips
+            # inline images. While one batch is being parsed, the next
+            # FETCH is already in flight on a prefetch thread; the
+            # connection stays single-threaded because only the prefetch
+            # thread issues IMAP commands at any given moment.
+            batches = [
+                to_fetch[start:start + FETCH_BATCH_SIZE]
+                for start in range(0, len(to_fetch), FETCH_BATCH_SIZE)
+            ]
+
+            if batches:
+                with ThreadPoolExecutor(max_workers=1) as executor, \
+                        ProcessPoolExecutor() as pool:
+                    pending = executor.submit(fetch_html_bodies, mail, batches[0])
+                    for next_batch in batches[1:] + [None]:
+                        fetched = pending.result()
+                        if next_batch is not None:
+                            pending = executor.submit(fetch_html_bodies, mail, next_batch)
+
+                        # Fast path: no term in the raw bytes means no match
+                        to_parse = []
+                        for uid, email_message, html_bytes in fetched:
+                            if html_bytes is not None and not watchlist_bytes_re.search(html_bytes):
+                                i += 1
+                                if verbose:
+                                    print(f"Processing email {i}/{len(recent_ids)}...")
+                                    print("  No watchlist terms present; skipping parse\n")
+                                continue
+                            to_parse.append((uid, email_message, html_bytes))
+
+                        # Tree building and regex scanning are CPU-bound,
+                        # so the surviving messages of each batch are
+                        # parsed across worker processes in parallel
+                        parsed_results = pool.map(
+                            parse_email_for_products,
+                            [message for _, message, _ in to_parse],
+                            [html for _, _, html in to_parse],
+                        )
+
+                        for (uid, _, _), parsed in zip(to_parse, parsed_results):
+                            i += 1
+                            if verbose:
+                                print(f"Processing email {i}/{len(recent_ids)}...")
+
+                            # Remember the result for next run
+                            cache[uid.decode()] = {
+                                "internaldate": internal_dates.get(uid),
+                                "parsed": parsed,
+                            }
+                            scan_parsed(parsed)
         
-        # Close connection
-        mail.logout()
-        
+        # Connection is intentionally left open (see connect_to_email);
+        # close_email_connection() tears it down at shutdown
+
         # Summary
         print(f"\n{'='*60}")
         print("SUMMARY")
@@ -9,214 +9,372 @@ This module provides an alternative data source for grocery specials that:
 - Is designed for public catalogue viewing
 - May have fewer anti-bot protections
 
+Scraping is async: one shared browser is launched per run and each
+catalogue is fetched in its own browser context so network-bound page
+loads can overlap via asyncio.gather.
+
 Note: Always respect Lasoo's terms of service and robots.txt
 """
 
-from playwright.sync_api import sync_playwright
+import asyncio
+import os
+from playwright.async_api import async_playwright
 from typing import List, Dict
-import time
 
+from src.matching import AHOCORASICK_AVAILABLE, build_automaton, build_pattern
+
+# Banner strings reused by every run instead of rebuilt per print
+EQ = "=" * 60
+DASH = "─" * 60
+
+
+# Point this at an already-running Chromium (--remote-debugging-port) to
+# share one browser across separate scraper runs
+CDP_ENDPOINT_ENV = "LASOO_CDP_ENDPOINT"
+
+# Shared driver + browser, launched once per process and reused by every
+# scrape call so Chromium startup is amortized across the whole run
+_PLAYWRIGHT = None
+_BROWSER = None
+
+
+async def get_browser():
+    """Return the shared headless browser, launching it on first use.
+
+    Honours the LASOO_CDP_ENDPOINT environment variable to connect to an
+    externally pooled Chromium over CDP instead of launching a new one.
+    """
+    global _PLAYWRIGHT, _BROWSER
+
+    if _BROWSER is not None and _BROWSER.is_connected():
+        return _BROWSER
+
+    if _PLAYWRIGHT is None:
+        _PLAYWRIGHT = await async_playwright().start()
+
+    endpoint = os.getenv(CDP_ENDPOINT_ENV, "")
+    if endpoint:
+        _BROWSER = await _PLAYWRIGHT.chromium.connect_over_cdp(endpoint)
+    else:
+        _BROWSER = await _PLAYWRIGHT.chromium.launch(headless=True)
+    return _BROWSER
+
+
+async def close_browser() -> None:
+    """Close the shared browser and stop the Playwright driver."""
+    global _PLAYWRIGHT, _BROWSER
+
+    if _BROWSER is not None:
+        try:
+            await _BROWSER.close()
+        except Exception:
+            pass
+        _BROWSER = None
+
+    if _PLAYWRIGHT is not None:
+        try:
+            await _PLAYWRIGHT.stop()
+        except Exception:
+            pass
+        _PLAYWRIGHT = None
+
+
+# Only text is scraped, so heavy assets and trackers are aborted up front
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+BLOCKED_URL_SNIPPETS = (
+    "google-analytics",
+    "googletagmanager",
+    "doubleclick",
+    "facebook",
+)
+
+
+async def block_heavy_requests(page) -> None:
+    """Abort image/font/analytics requests before navigation.
+
+    Args:
+        page: Page to install the route handler on
+    """
+    async def _route_handler(route):
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+            snippet in request.url for snippet in BLOCKED_URL_SNIPPETS
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await page.route("**/*", _route_handler)
 
-def fetch_lasoo_catalogues(store_name: str, postcode: str = "2000") -> List[Dict]:
+
+async def fetch_lasoo_catalogues(browser, store_name: str, postcode: str = "2000") -> List[Dict]:
     """Fetch available catalogues for a store from Lasoo.
-    
+
     Args:
+        browser: Shared Playwright browser instance
         store_name: Store name (e.g., "coles", "woolworths")
         postcode: Australian postcode for location-specific catalogues
-        
+
     Returns:
         List of catalogue dictionaries with titles and URLs
     """
     catalogues = []
-    
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        
-        # Lasoo search URL
-        url = f"https://www.lasoo.com.au/{store_name}-catalogues"
-        
+
+    # Fresh context keeps cookies isolated while reusing the shared browser
+    context = await browser.new_context()
+    page = await context.new_page()
+    await block_heavy_requests(page)
+
+    # Lasoo search URL
+    url = f"https://www.lasoo.com.au/{store_name}-catalogues"
+
+    try:
+        print(f"Loading Lasoo page for {store_name}...")
+        await page.goto(url, timeout=30000)
+
+        # Wait for catalogue links directly instead of networkidle, which
+        # analytics beacons can keep from ever settling
         try:
-            print(f"Loading Lasoo page for {store_name}...")
-            page.goto(url, timeout=30000)
-            page.wait_for_load_state("networkidle", timeout=15000)
-            
-            # Look for catalogue cards/links
-            # Note: Selectors may need adjustment based on actual Lasoo structure
-            catalogue_links = page.query_selector_all("a[href*='catalogue']")
-            
-            for link in catalogue_links[:10]:  # Limit to 10 most recent
-                try:
-                    title = link.inner_text().strip()
-                    href = link.get_attribute("href")
-                    
-                    if title and href and len(title) > 5:
-                        full_url = href if href.startswith("http") else f"https://www.lasoo.com.au{href}"
-                        catalogues.append({
-                            "title": title,
-                            "url": full_url,
-                            "store": store_name
-                        })
-                except:
-                    continue
-            
-            print(f"  Found {len(catalogues)} catalogues")
-            
-        except Exception as e:
-            print(f"  Error loading Lasoo: {e}")
-        finally:
-            browser.close()
-    
+            await page.wait_for_selector("a[href*='catalogue']", timeout=15000)
+        except Exception:
+            pass
+
+        # Look for catalogue cards/links in one in-page pass instead of a
+        # CDP round-trip per link handle
+        # Note: Selectors may need adjustment based on actual Lasoo structure
+        catalogue_links = await page.evaluate(
+            """() => Array.from(document.querySelectorAll("a[href*='catalogue']"))
+                .slice(0, 10)
+                .map((link) => ({
+                    title: (link.innerText || '').trim(),
+                    href: link.getAttribute('href') || '',
+                }))"""
+        )
+
+        for link in catalogue_links:  # Limit of 10 most recent applied in-page
+            title = link["title"]
+            href = link["href"]
+
+            if title and href and len(title) > 5:
+                full_url = href if href.startswith("http") else f"https://www.lasoo.com.au{href}"
+                catalogues.append({
+                    "title": title,
+                    "url": full_url,
+                    "store": store_name
+                })
+
+        print(f"  Found {len(catalogues)} catalogues")
+
+    except Exception as e:
+        print(f"  Error loading Lasoo: {e}")
+    finally:
+        await context.close()
+
     return catalogues
 
 
-def scrape_lasoo_catalogue(catalogue_url: str, store_name: str) -> List[str]:
+async def scrape_lasoo_catalogue(browser, catalogue_url: str, store_name: str) -> List[str]:
     """Scrape product items from a Lasoo catalogue page.
-    
+
     Args:
+        browser: Shared Playwright browser instance
         catalogue_url: URL of the catalogue on Lasoo
         store_name: Store name for context
-        
+
     Returns:
         List of product text strings
     """
     products = []
-    
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        
-        try:
-            print(f"  Loading catalogue: {catalogue_url[:60]}...")
-            page.goto(catalogue_url, timeout=45000)
-            
-            # Wait for content to load
-            page.wait_for_load_state("networkidle", timeout=20000)
-            
-            # Give extra time for dynamic content
-            time.sleep(3)
-            
-            # Try multiple selector strategies for Lasoo
-            selectors_to_try = [
-                "div[class*='product']",
-                "div[class*='item']",
-                "div[class*='offer']",
-                "div[class*='special']",
-                "article",
-                "div[class*='tile']",
-                ".product-card",
-                ".catalogue-item",
-            ]
-            
-            for selector in selectors_to_try:
-                elements = page.query_selector_all(selector)
-                if elements and len(elements) > 5:
-                    print(f"    Using selector: {selector} ({len(elements)} items)")
-                    for el in elements:
-                        try:
-                            text = el.inner_text().strip()
-                            if text and len(text) > 5:
-                                products.append(text)
-                        except:
-                            continue
-                    break
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_products = []
-            for p in products:
-                if p not in seen:
-                    seen.add(p)
-                    unique_products.append(p)
-            
-            print(f"    Scraped {len(unique_products)} products")
-            return unique_products[:200]  # Limit to 200 items
-            
-        except Exception as e:
-            print(f"    Error scraping catalogue: {e}")
-            return []
-        finally:
-            browser.close()
+
+    context = await browser.new_context()
+    page = await context.new_page()
+    await block_heavy_requests(page)
+
+    try:
+        print(f"  Loading catalogue: {catalogue_url[:60]}...")
+        await page.goto(catalogue_url, timeout=45000)
+
+        # Try multiple selector strategies for Lasoo
+        selectors_to_try = [
+            "div[class*='product']",
+            "div[class*='item']",
+            "div[class*='offer']",
+            "div[class*='special']",
+            "article",
+            "div[class*='tile']",
+            ".product-card",
+            ".catalogue-item",
+        ]
+
+        # Wait for the first known product selector instead of networkidle
+        # plus a fixed sleep; scraping starts as soon as tiles exist
+        for selector in selectors_to_try:
+            try:
+                await page.wait_for_selector(selector, timeout=5000)
+                break
+            except Exception:
+                continue
+
+        # Pick the first matching selector and pull its texts in a single
+        # in-page pass — no element handles, no per-selector round-trip
+        result = await page.evaluate(
+            """(selectors) => {
+                for (const selector of selectors) {
+                    const nodes = document.querySelectorAll(selector);
+                    if (nodes.length > 5) {
+                        return {
+                            selector,
+                            texts: Array.from(nodes)
+                                .map((el) => (el.innerText || '').trim())
+                                .filter((text) => text.length > 5),
+                        };
+                    }
+                }
+                return null;
+            }""",
+            selectors_to_try,
+        )
+        if result:
+            products = result["texts"]
+            print(f"    Using selector: {result['selector']} ({len(products)} items)")
+
+        # Remove duplicates while preserving order
+        unique_products = list(dict.fromkeys(products))
+
+        print(f"    Scraped {len(unique_products)} products")
+        return unique_products[:200]  # Limit to 200 items
+
+    except Exception as e:
+        print(f"    Error scraping catalogue: {e}")
+        return []
+    finally:
+        await context.close()
 
 
 def find_matches(products: List[str], watchlist: List[str]) -> List[str]:
     """Find products matching the watchlist.
-    
+
     Args:
         products: List of product strings
         watchlist: List of keywords to match
-        
+
     Returns:
         List of matching products
     """
-    matches = []
-    for product in products:
-        lower_product = product.lower()
-        for term in watchlist:
-            if term.lower() in lower_product:
-                matches.append(product)
-                break
-    return matches
+    if not products or not watchlist:
+        return []
+
+    # Lowercase terms once and reuse the compiled matcher across every
+    # catalogue scanned with the same watchlist
+    lower_terms = tuple(term.lower() for term in watchlist)
+
+    if AHOCORASICK_AVAILABLE:
+        # One automaton scans each product in a single linear pass instead
+        # of a substring search per watchlist term
+        automaton = build_automaton(lower_terms)
+        return [
+            product
+            for product in products
+            if next(automaton.iter(product.lower()), None) is not None
+        ]
 
+    # Fallback: a compiled alternation gives the same single-pass scan
+    pattern = build_pattern(lower_terms)
+    return [product for product in products if pattern.search(product)]
 
-def scrape_lasoo_stores(stores: List[str], watchlist: List[str], postcode: str = "2000") -> Dict[str, List[str]]:
+
+async def _process_store(browser, store: str, watchlist: List[str], postcode: str) -> Dict[str, List[str]]:
+    """Fetch and scan one store's top catalogues.
+
+    Args:
+        browser: Shared Playwright browser instance
+        store: Store name (e.g., "coles")
+        watchlist: List of product keywords to search for
+        postcode: Australian postcode
+
+    Returns:
+        Dictionary mapping "Store - Catalogue" keys to matching products
+    """
+    print(f"\n{DASH}")
+    print(f"Processing: {store.upper()}")
+    print(f"{DASH}")
+
+    # Get available catalogues
+    catalogues = await fetch_lasoo_catalogues(browser, store, postcode)
+
+    if not catalogues:
+        print(f"  No catalogues found for {store}")
+        return {}
+
+    # Scrape the top catalogues concurrently (usually just need the latest)
+    top_catalogues = catalogues[:2]  # Process top 2 catalogues
+    tasks = [
+        scrape_lasoo_catalogue(browser, catalogue['url'], store)
+        for catalogue in top_catalogues
+    ]
+    catalogue_products = await asyncio.gather(*tasks)
+
+    store_matches = {}
+    for i, (catalogue, products) in enumerate(
+        zip(top_catalogues, catalogue_products), 1
+    ):
+        print(f"\n  Catalogue {i}: {catalogue['title']}")
+
+        if not products:
+            print(f"    No products found")
+            continue
+
+        # Find matches
+        matches = find_matches(products, watchlist)
+
+        if matches:
+            store_key = f"{store.title()} - {catalogue['title']}"
+            store_matches[store_key] = matches
+            print(f"    ✓ Found {len(matches)} matching items!")
+        else:
+            print(f"    No matches in watchlist")
+
+    return store_matches
+
+
+async def scrape_lasoo_stores(stores: List[str], watchlist: List[str], postcode: str = "2000") -> Dict[str, List[str]]:
     """Main function to scrape multiple stores from Lasoo.
-    
+
     Args:
         stores: List of store names (e.g., ["coles", "woolworths"])
         watchlist: List of product keywords to search for
         postcode: Australian postcode
-        
+
     Returns:
         Dictionary mapping store names to matching products
     """
-    print(f"\n{'='*60}")
+    print(f"\n{EQ}")
     print("LASOO CATALOGUE SCRAPER")
-    print(f"{'='*60}\n")
+    print(f"{EQ}\n")
     print(f"Stores: {', '.join(stores)}")
     print(f"Postcode: {postcode}")
     print(f"Watchlist: {', '.join(watchlist)}\n")
-    
+
     all_matches = {}
-    
-    for store in stores:
-        print(f"\n{'─'*60}")
-        print(f"Processing: {store.upper()}")
-        print(f"{'─'*60}")
-        
-        # Get available catalogues
-        catalogues = fetch_lasoo_catalogues(store, postcode)
-        
-        if not catalogues:
-            print(f"  No catalogues found for {store}")
-            continue
-        
-        # Process each catalogue (usually just need the latest)
-        for i, catalogue in enumerate(catalogues[:2], 1):  # Process top 2 catalogues
-            print(f"\n  Catalogue {i}: {catalogue['title']}")
-            
-            # Scrape products from this catalogue
-            products = scrape_lasoo_catalogue(catalogue['url'], store)
-            
-            if not products:
-                print(f"    No products found")
-                continue
-            
-            # Find matches
-            matches = find_matches(products, watchlist)
-            
-            if matches:
-                store_key = f"{store.title()} - {catalogue['title']}"
-                all_matches[store_key] = matches
-                print(f"    ✓ Found {len(matches)} matching items!")
-            else:
-                print(f"    No matches in watchlist")
-    
+
+    # One pooled browser shared by every catalogue task; contexts isolate them
+    browser = await get_browser()
+
+    # Stores are independent I/O, so fetch them concurrently too
+    store_results = await asyncio.gather(
+        *(
+            _process_store(browser, store, watchlist, postcode)
+            for store in stores
+        )
+    )
+    for store_matches in store_results:
+        all_matches.update(store_matches)
+
     # Summary
-    print(f"\n{'='*60}")
+    print(f"\n{EQ}")
     print("SUMMARY")
-    print(f"{'='*60}\n")
-    
+    print(f"{EQ}\n")
+
     total_matches = sum(len(items) for items in all_matches.values())
     if total_matches > 0:
         print(f"✓ Found {total_matches} matching products across {len(all_matches)} catalogues\n")
@@ -229,7 +387,7 @@ def scrape_lasoo_stores(stores: List[str], watchlist: List[str], postcode: str =
             print()
     else:
         print("No matches found in catalogues.")
-    
+
     return all_matches
 
 
@@ -248,13 +406,21 @@ def main() -> None:
         "Bread"
     ]
     postcode = "2000"  # Sydney CBD
-    
-    # Run scraper
-    matches = scrape_lasoo_stores(stores, watchlist, postcode)
-    
-    print("="*60)
+
+    # Single asyncio.run for the entire invocation: every catalogue fetch
+    # and scrape shares one event loop, one Playwright driver and the
+    # pooled browser, which is released only once the run is done
+    async def run() -> Dict[str, List[str]]:
+        try:
+            return await scrape_lasoo_stores(stores, watchlist, postcode)
+        finally:
+            await close_browser()
+
+    matches = asyncio.run(run())
+
+    print(EQ)
     print("DONE")
-    print("="*60)
+    print(EQ)
     print("\nNote: Lasoo structure may change. Update selectors as needed.")
     print("Check their robots.txt and terms of service before production use.")
 
@@ -9,9 +9,21 @@ from playwright.sync_api import sync_playwright
 import os
 import sys
 import smtplib
+import threading
 from email.mime.text import MIMEText
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+from src.matching import AHOCORASICK_AVAILABLE, build_automaton, build_pattern
+
+# Banner strings reused by every run instead of rebuilt per print
+EQ = "=" * 60
+BANG = "!" * 60
+
+# Stores scrape on worker threads but share one browser_session.json;
+# the lock keeps concurrent saves from interleaving writes to it
+_SESSION_FILE_LOCK = threading.Lock()
+
 # -----------------------------
 # CONFIGURATION
 # -----------------------------
@@ -120,43 +132,76 @@ def _append_to_log(log_file: str, message: str) -> None:
         print(f"Warning: Could not write to log file {log_file}: {e}")
 
 
-def fetch_items(url: str, product_selector: str, use_saved_session: bool = True) -> list[str]:
+# Resource types and tracker domains the scraper never needs; only the
+# product text is read, so skipping these cuts most of the bandwidth
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+BLOCKED_URL_SNIPPETS = (
+    "google-analytics",
+    "googletagmanager",
+    "doubleclick",
+    "facebook",
+)
+
+
+def _block_heavy_requests(page) -> None:
+    """Abort requests for images, media, fonts, styles, and trackers.
+
+    Args:
+        page: Playwright page to install the route handler on
+    """
+    def handler(route):
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+            snippet in request.url for snippet in BLOCKED_URL_SNIPPETS
+        ):
+            route.abort()
+        else:
+            route.continue_()
+
+    page.route("**/*", handler)
+
+
+def fetch_items(browser, url: str, product_selector: str, use_saved_session: bool = True) -> list[str]:
     """Scrape product listings from a store's website.
-    
+
     Args:
+        browser: Shared Playwright browser instance to open the page in
         url: The URL of the store's catalogue/specials page
         product_selector: CSS selector to find product elements on the page
         use_saved_session: If True, load saved cookies/session (e.g., postcode)
-        
+
     Returns:
         A list of product text strings found on the page
-        
+
     Note:
-        Uses Playwright in headless mode to handle JavaScript-rendered content.
+        Opens a fresh browser context per store for cookie isolation while
+        reusing the caller's browser, avoiding a Chromium cold start per URL.
         Includes fallback scrolling mechanism for lazy-loaded content.
         Can save and reuse cookies/sessions to maintain location preferences.
     """
-    with sync_playwright() as p:
-        # Launch browser in headless mode (no visible window)
-        browser = p.chromium.launch(headless=True)
-        
-        # Check if we have saved session data (cookies, localStorage, etc.)
-        session_file = "browser_session.json"
-        if use_saved_session and os.path.exists(session_file):
-            # Load previously saved session (includes cookies, postcode, etc.)
+    # Check if we have saved session data (cookies, localStorage, etc.)
+    session_file = "browser_session.json"
+    if use_saved_session and os.path.exists(session_file):
+        # Load previously saved session (includes cookies, postcode, etc.),
+        # under the same lock so a save in another thread can't be read
+        # half-written
+        with _SESSION_FILE_LOCK:
             context = browser.new_context(storage_state=session_file)
-            page = context.new_page()
-            print(f"  → Loaded saved session from {session_file}")
-        else:
-            # Create new session
-            page = browser.new_page()
-        
-        # Navigate to the store's specials page with 60 second timeout
-        page.goto(url, timeout=60000)
-        
-        # Wait until network is idle (all resources loaded)
-        page.wait_for_load_state("networkidle")
-        
+        print(f"  → Loaded saved session from {session_file}")
+    else:
+        # Create new session
+        context = browser.new_context()
+
+    try:
+        page = context.new_page()
+        _block_heavy_requests(page)
+
+        # Navigate to the store's specials page with 60 second timeout.
+        # domcontentloaded is enough: the selector wait below is the real
+        # readiness signal, whereas networkidle can stall for 30s+ on
+        # analytics beacons that never quiesce on retail sites.
+        page.goto(url, wait_until="domcontentloaded", timeout=60000)
+
         try:
             # Wait for product elements to appear (15 second timeout)
             page.wait_for_selector(product_selector, timeout=15000)
@@ -168,57 +213,99 @@ def fetch_items(url: str, product_selector: str, use_saved_session: bool = True)
                 page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
                 # Wait 1 second for content to load
                 page.wait_for_timeout(1000)
-        
+                # Stop scrolling as soon as products have shown up
+                if page.locator(product_selector).count() > 0:
+                    break
+
         # Find all product elements matching the selector
         elements = page.query_selector_all(product_selector)
         items = []
-        
+
         # Extract text from each product element
         for el in elements:
             txt = (el.inner_text() or "").strip()
             if txt:  # Only add non-empty text
                 items.append(txt)
-        
-        # Save session data for next time (includes cookies, localStorage, postcode)
+
+        # Save session data for next time (includes cookies, localStorage,
+        # postcode). Serialised: worker threads all write the same file.
         if use_saved_session:
             try:
-                if 'context' in locals():
+                with _SESSION_FILE_LOCK:
                     context.storage_state(path=session_file)
-                else:
-                    page.context.storage_state(path=session_file)
                 print(f"  → Session saved to {session_file}")
             except Exception as e:
                 print(f"  → Could not save session: {e}")
-        
-        # Clean up: close the browser
-        browser.close()
+
         return items
+    finally:
+        # Clean up: close only this store's context, not the shared browser
+        context.close()
+
+
+def _scrape_store_batch(stores: list[dict]) -> dict[str, list[str]]:
+    """Scrape a batch of stores, sharing one browser across the batch.
+
+    Args:
+        stores: Store configuration dicts (name, url, product_selector)
+
+    Returns:
+        Dictionary mapping store names to scraped items
+
+    Note:
+        Runs in a worker thread. Sync Playwright objects are bound to the
+        thread that created them, so each worker launches one browser and
+        amortizes it over every store in its batch.
+    """
+    results = {}
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        try:
+            for store in stores:
+                try:
+                    results[store["name"]] = fetch_items(
+                        browser, store["url"], store["product_selector"]
+                    )
+                except Exception as e:
+                    print(f"Error fetching {store['name']}: {e}")
+                    results[store["name"]] = []
+        finally:
+            browser.close()
+    return results
 
 def find_matches(items: list[str], watchlist: list[str]) -> list[str]:
     """Filter items to find those matching the watchlist.
-    
+
     Args:
         items: List of product text strings scraped from a store
         watchlist: List of keywords to search for (case-insensitive)
-        
+
     Returns:
         List of items that contain at least one watchlist keyword
-        
+
     Note:
         Uses case-insensitive substring matching. Each item is added only once
-        even if it matches multiple watchlist terms.
+        even if it matches multiple watchlist terms - all terms are matched
+        in a single linear scan per item instead of one substring search
+        per term.
     """
-    matches = []
-    for item in items:
-        # Convert to lowercase for case-insensitive matching
-        lower_item = item.lower()
-        
-        # Check if any watchlist term appears in this item
-        for term in watchlist:
-            if term.lower() in lower_item:
-                matches.append(item)
-                break  # Don't add the same item twice
-    return matches
+    if not items or not watchlist:
+        return []
+
+    # Lowercase terms once and reuse the compiled matcher across stores
+    lower_terms = tuple(term.lower() for term in watchlist)
+
+    if AHOCORASICK_AVAILABLE:
+        automaton = build_automaton(lower_terms)
+        return [
+            item
+            for item in items
+            if next(automaton.iter(item.lower()), None) is not None
+        ]
+
+    # Fallback: a compiled alternation gives the same single-pass scan
+    pattern = build_pattern(lower_terms)
+    return [item for item in items if pattern.search(item)]
 
 def send_email_alert(store_matches: dict[str, list[str]], scrape_test: bool = False, log_file: str = None) -> None:
     """Send an email alert with all found matches.
@@ -257,15 +344,15 @@ def send_email_alert(store_matches: dict[str, list[str]], scrape_test: bool = Fa
     # Scrape test mode: print email content instead of sending
     if scrape_test:
         output = [
-            "\n" + "="*60,
+            "\n" + EQ,
             "SCRAPE TEST MODE - Email Preview:",
-            "="*60,
+            EQ,
             f"Subject: Coles/Woolworths Sale Alert",
             f"From: {EMAIL_USER}",
             f"To: {EMAIL_TO}",
             "",
             body,
-            "="*60,
+            EQ,
             f"[SCRAPE TEST] Would have sent email with {total} match(es).",
             ""
         ]
@@ -312,26 +399,38 @@ def main() -> None:
     log_file = SCRAPE_TEST_LOG if scrape_test_mode else None
     
     if scrape_test_mode:
-        print("\n" + "!"*60)
+        print("\n" + BANG)
         print("SCRAPE TEST MODE ENABLED - No emails will be sent")
         if log_file:
             print(f"Output will be logged to: {log_file}")
-        print("!"*60 + "\n")
+        print(BANG + "\n")
         _append_to_log(log_file, "=== SCRAPE TEST SESSION STARTED ===")
     
     results = {}
-    
-    # Scrape each store and check for watchlist matches
+
+    # Scrape stores concurrently: page loads are network-bound, so worker
+    # threads overlap the waiting. Stores are partitioned round-robin and
+    # each worker launches a single browser for its whole batch; results
+    # are consumed on the main thread so logging needs no locking.
+    num_workers = min(len(STORES), 4)
+    batches = [STORES[i::num_workers] for i in range(num_workers)]
+
     for store in STORES:
-        store_name = store['name']
-        print(f"Fetching: {store_name} ...")
-        
+        print(f"Fetching: {store['name']} ...")
         if scrape_test_mode and log_file:
-            _append_to_log(log_file, f"--- Fetching: {store_name} ---")
-        
-        # Get all product items from the store's page
-        items = fetch_items(store["url"], store["product_selector"])
-        
+            _append_to_log(log_file, f"--- Fetching: {store['name']} ---")
+
+    store_items = {}
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = [executor.submit(_scrape_store_batch, batch) for batch in batches]
+        for future in as_completed(futures):
+            store_items.update(future.result())
+
+    # Check each store's items for watchlist matches
+    for store in STORES:
+        store_name = store['name']
+        items = store_items.get(store_name, [])
+
         # In scrape test mode, log all scraped items (not just matches)
         if scrape_test_mode:
             scrape_info = f"\nTotal items scraped from {store_name}: {len(items)}"
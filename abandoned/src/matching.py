@@ -0,0 +1,38 @@
+"""Shared watchlist matching helpers.
+
+Every scraper/parser in this package answers the same question — does a
+piece of product text mention any watchlist term? — so the matcher
+construction lives here once. When pyahocorasick is installed a single
+automaton scans each haystack in one linear pass regardless of how many
+terms are on the watchlist; otherwise a compiled regex alternation gives
+the same single-pass behaviour.
+
+Both builders are cached per watchlist, so repeated find_matches calls
+across catalogues, pages, or emails reuse one compiled matcher.
+"""
+
+import re
+from functools import lru_cache
+
+# Try to import pyahocorasick for fast multi-pattern watchlist matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+@lru_cache(maxsize=8)
+def build_automaton(lower_terms: tuple):
+    """Build an Aho-Corasick automaton, cached per watchlist."""
+    automaton = ahocorasick.Automaton()
+    for term in lower_terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=8)
+def build_pattern(lower_terms: tuple):
+    """Build the fallback alternation regex, cached per watchlist."""
+    return re.compile("|".join(map(re.escape, lower_terms)), re.IGNORECASE)
@@ -22,14 +22,30 @@ Usage:
     python -m src.pdf_parser /path/to/catalogue.pdf
 """
 
+import hashlib
+import json
 import os
+import queue
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import List, Dict, Tuple, Optional
 from pathlib import Path
 import urllib.request
 from datetime import datetime
 
-# Try to import PDF libraries
+from src.matching import AHOCORASICK_AVAILABLE, build_automaton, build_pattern
+
+# Try to import PDF libraries. PyMuPDF's C core extracts text orders of
+# magnitude faster than the pure-Python pdfminer stack, so it is the
+# preferred backend when installed.
+try:
+    import fitz
+    FITZ_AVAILABLE = True
+except ImportError:
+    FITZ_AVAILABLE = False
+
 try:
     import pdfplumber
     PDFPLUMBER_AVAILABLE = True
@@ -44,82 +60,323 @@ except ImportError:
     PYPDF2_AVAILABLE = False
     print("Warning: PyPDF2 not installed. Install with: pip install pypdf2")
 
+# Price patterns compiled once at import instead of on every
+# parse_products call; ASCII keeps the digit classes from expanding to
+# their Unicode equivalents
+_PRICE_RE = re.compile(r'\$\s*(\d+)\.(\d{2})', re.ASCII)
+_SAVE_RE = re.compile(r'save\s+\$\s*(\d+\.?\d*)', re.ASCII | re.IGNORECASE)
+_PCT_RE = re.compile(r'(\d+)%\s+off', re.ASCII | re.IGNORECASE)
+_WS_RE = re.compile(r'\s+')
+
+# All three offer patterns combined so each line is traversed once
+# instead of once per pattern
+_OFFER_RE = re.compile(
+    r'\$\s*(?P<dollars>\d+)\.(?P<cents>\d{2})'
+    r'|(?P<save>save\s+\$\s*(?P<save_amt>\d+\.?\d*))'
+    r'|(?P<pct_val>\d+)%\s+off',
+    re.ASCII | re.IGNORECASE,
+)
+
+# Pages handed to each extraction worker in one go; large enough to
+# amortize opening the PDF per process, small enough to balance load
+PAGE_BLOCK_SIZE = 10
+
+# Pages buffered between the extraction thread and the parsing loop;
+# bounds memory while keeping both stages busy
+PIPELINE_QUEUE_SIZE = 8
+
+# Extracted text is cached here keyed on the PDF's content hash, so
+# unchanged catalogues skip extraction entirely on later runs
+CACHE_DIR = Path.home() / ".cache" / "specials-agent"
+
+
+def _file_sha1(path: str) -> str:
+    """Hash a file's contents in chunks without loading it whole.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Hex SHA-1 digest of the file contents
+    """
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _get_max_workers() -> int:
+    """Worker count for parallel extraction.
+
+    Honours the PDF_PARSER_THREADS environment variable (also set by the
+    --threads CLI flag), defaulting to the machine's core count.
+    """
+    env = os.getenv("PDF_PARSER_THREADS", "")
+    if env.isdigit() and int(env) > 0:
+        return int(env)
+    return os.cpu_count() or 1
+
+
+def _extract_page_range(pdf_path: str, start: int, end: int) -> List[str]:
+    """Extract text for pages [start, end) of one PDF.
+
+    Module-level so it is picklable for the process pool; each worker
+    opens its own handle because pdfplumber objects can't cross
+    process boundaries.
+
+    Args:
+        pdf_path: Path to the PDF file
+        start: First page index (inclusive)
+        end: Last page index (exclusive)
+
+    Returns:
+        List of per-page text strings (empty where extraction fails)
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        return [pdf.pages[i].extract_text() or "" for i in range(start, end)]
+
 
 class CataloguePDF:
     """Class to handle PDF catalogue parsing."""
     
-    def __init__(self, pdf_path: str):
+    def __init__(self, pdf_path: str, backend: Optional[str] = None):
         """Initialize with path to PDF file.
-        
+
         Args:
             pdf_path: Path to PDF file
+            backend: Force a specific extractor ('fitz', 'pdfplumber' or
+                'pypdf2') instead of auto-selecting; handy for
+                benchmarking backends against each other
         """
         self.pdf_path = pdf_path
+        self.backend = backend
         self.text_content = ""
         self.products = []
-        
-    def extract_text_pdfplumber(self) -> str:
-        """Extract text using pdfplumber (preferred method).
-        
+
+    def iter_pages_fitz(self):
+        """Yield per-page text using PyMuPDF (fastest method).
+
+        Yields:
+            Text of each page (empty string where extraction fails)
+        """
+        if not FITZ_AVAILABLE:
+            raise ImportError("PyMuPDF not installed")
+
+        with fitz.open(self.pdf_path) as doc:
+            for page in doc:
+                yield page.get_text("text") or ""
+
+    def extract_text_fitz(self) -> str:
+        """Extract text using PyMuPDF (fastest method).
+
         Returns:
             Extracted text from all pages
         """
+        print(f"Extracting text from PDF using PyMuPDF...")
+        text = [t for t in self.iter_pages_fitz() if t]
+        print(f"  ✓ Extracted text from {len(text)} pages")
+        return "\n\n".join(text)
+
+    def iter_pages_pdfplumber(self):
+        """Yield per-page text using pdfplumber (preferred method).
+
+        Page blocks still extract in parallel worker processes; map()
+        hands blocks back lazily in page order, so peak memory stays at
+        one block of pages rather than the whole catalogue.
+
+        Yields:
+            Text of each page (empty string where extraction fails)
+        """
         if not PDFPLUMBER_AVAILABLE:
             raise ImportError("pdfplumber not installed")
-        
-        text = []
-        print(f"Extracting text from PDF using pdfplumber...")
-        
+
         with pdfplumber.open(self.pdf_path) as pdf:
-            print(f"  Total pages: {len(pdf.pages)}")
-            
-            for i, page in enumerate(pdf.pages, 1):
-                print(f"  Processing page {i}/{len(pdf.pages)}...", end="\r")
-                page_text = page.extract_text()
-                if page_text:
-                    text.append(page_text)
-        
-        print(f"\n  ✓ Extracted text from {len(pdf.pages)} pages")
-        return "\n\n".join(text)
-    
-    def extract_text_pypdf2(self) -> str:
-        """Extract text using PyPDF2 (fallback method).
-        
+            total_pages = len(pdf.pages)
+
+        if total_pages <= PAGE_BLOCK_SIZE or _get_max_workers() == 1:
+            # Not worth the process startup cost for small PDFs (or when
+            # a single worker was requested, e.g. inside a batch worker)
+            yield from _extract_page_range(self.pdf_path, 0, total_pages)
+            return
+
+        # pdfminer parsing is CPU-bound, so page blocks extract in
+        # parallel worker processes
+        blocks = [
+            (start, min(start + PAGE_BLOCK_SIZE, total_pages))
+            for start in range(0, total_pages, PAGE_BLOCK_SIZE)
+        ]
+        with ProcessPoolExecutor(max_workers=_get_max_workers()) as pool:
+            for block_text in pool.map(
+                _extract_page_range,
+                [self.pdf_path] * len(blocks),
+                [start for start, _ in blocks],
+                [end for _, end in blocks],
+            ):
+                yield from block_text
+
+    def extract_text_pdfplumber(self) -> str:
+        """Extract text using pdfplumber (preferred method).
+
         Returns:
             Extracted text from all pages
         """
+        print(f"Extracting text from PDF using pdfplumber...")
+        text = [t for t in self.iter_pages_pdfplumber() if t]
+        print(f"  ✓ Extracted text from {len(text)} pages")
+        return "\n\n".join(text)
+
+    def iter_pages_pypdf2(self):
+        """Yield per-page text using PyPDF2 (fallback method).
+
+        Yields:
+            Text of each page (empty string where extraction fails)
+        """
         if not PYPDF2_AVAILABLE:
             raise ImportError("PyPDF2 not installed")
-        
+
+        reader = PdfReader(self.pdf_path)
+        for page in reader.pages:
+            yield page.extract_text() or ""
+
+    def extract_text_pypdf2(self, verbose: bool = False) -> str:
+        """Extract text using PyPDF2 (fallback method).
+
+        Args:
+            verbose: Print per-page progress (each print flushes the
+                terminal, which is measurable inside the tight loop)
+
+        Returns:
+            Extracted text from all pages
+        """
         text = []
         print(f"Extracting text from PDF using PyPDF2...")
-        
-        reader = PdfReader(self.pdf_path)
-        print(f"  Total pages: {len(reader.pages)}")
-        
-        for i, page in enumerate(reader.pages, 1):
-            print(f"  Processing page {i}/{len(reader.pages)}...", end="\r")
-            page_text = page.extract_text()
+
+        for i, page_text in enumerate(self.iter_pages_pypdf2(), 1):
+            if verbose:
+                print(f"  Processing page {i}...", end="\r")
             if page_text:
                 text.append(page_text)
-        
-        print(f"\n  ✓ Extracted text from {len(reader.pages)} pages")
+
+        if verbose:
+            print()
+        print(f"  ✓ Extracted text from {len(text)} pages")
         return "\n\n".join(text)
+
+    def _select_backend(self) -> str:
+        """Pick the extraction backend for this catalogue.
+
+        Honours the ``backend=`` constructor argument, otherwise prefers
+        PyMuPDF, then pdfplumber, then PyPDF2.
+
+        Returns:
+            Backend name: 'fitz', 'pdfplumber' or 'pypdf2'
+        """
+        if self.backend:
+            return self.backend
+        if FITZ_AVAILABLE:
+            return "fitz"
+        if PDFPLUMBER_AVAILABLE:
+            return "pdfplumber"
+        if PYPDF2_AVAILABLE:
+            return "pypdf2"
+        raise ImportError(
+            "No PDF library available. Install pymupdf, pdfplumber or pypdf2"
+        )
+
+    def iter_pages(self):
+        """Yield per-page text using the best available backend.
+
+        Yields:
+            Text of each page
+        """
+        backend = self._select_backend()
+        if backend == "fitz":
+            yield from self.iter_pages_fitz()
+        elif backend == "pdfplumber":
+            yield from self.iter_pages_pdfplumber()
+        elif backend == "pypdf2":
+            yield from self.iter_pages_pypdf2()
+        else:
+            raise ValueError(f"Unknown PDF backend: {backend}")
     
-    def extract_text(self) -> str:
+    def iter_pages_pipelined(self):
+        """Yield per-page text while a background thread keeps extracting.
+
+        Extraction (pdfminer IO/CPU, which releases the GIL in its C
+        calls) runs in a producer thread feeding a bounded queue, so the
+        caller's regex parsing overlaps with extraction of later pages
+        instead of running strictly after it.
+
+        Yields:
+            Text of each page
+        """
+        pages: queue.Queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        failure = []
+
+        def produce():
+            try:
+                for page_text in self.iter_pages():
+                    pages.put(page_text)
+            except BaseException as exc:
+                failure.append(exc)
+            finally:
+                pages.put(None)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        while (page_text := pages.get()) is not None:
+            yield page_text
+        producer.join()
+        if failure:
+            raise failure[0]
+
+    def extract_text(self, use_cache: bool = True) -> str:
         """Extract text using best available method.
-        
+
+        Results are cached under ~/.cache/specials-agent/ keyed on the
+        PDF's SHA-1, so re-running over an unchanged catalogue reads the
+        cached text instead of reparsing the PDF.
+
+        Args:
+            use_cache: Serve and populate the content-hash cache
+
         Returns:
             Extracted text from PDF
         """
-        # Try pdfplumber first (better extraction)
-        if PDFPLUMBER_AVAILABLE:
+        cache_file = None
+        if use_cache:
+            cache_file = CACHE_DIR / f"{_file_sha1(self.pdf_path)}.json"
+            if cache_file.exists():
+                try:
+                    self.text_content = json.loads(
+                        cache_file.read_text(encoding='utf-8')
+                    )['text']
+                    print(f"  ✓ Using cached text ({cache_file.name})")
+                    return self.text_content
+                except (OSError, ValueError, KeyError):
+                    pass  # Corrupt cache entry; fall through and reparse
+
+        # Try PyMuPDF first (fastest), then pdfplumber, then PyPDF2
+        backend = self._select_backend()
+        if backend == "fitz":
+            self.text_content = self.extract_text_fitz()
+        elif backend == "pdfplumber":
             self.text_content = self.extract_text_pdfplumber()
-        elif PYPDF2_AVAILABLE:
+        elif backend == "pypdf2":
             self.text_content = self.extract_text_pypdf2()
         else:
-            raise ImportError("No PDF library available. Install pdfplumber or pypdf2")
-        
+            raise ValueError(f"Unknown PDF backend: {backend}")
+
+        if cache_file is not None:
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(
+                    json.dumps({'text': self.text_content}), encoding='utf-8'
+                )
+            except OSError as e:
+                print(f"Warning: Could not write text cache: {e}")
+
         return self.text_content
     
     def parse_products(self) -> List[Dict]:
@@ -128,68 +385,87 @@ class CataloguePDF:
         Returns:
             List of product dictionaries with name and price
         """
-        if not self.text_content:
-            self.extract_text()
-        
-        products = []
-        
-        # Price patterns to match
-        price_pattern = re.compile(r'\$\s*(\d+)\.(\d{2})')
-        save_pattern = re.compile(r'[Ss]ave\s+\$\s*(\d+\.?\d*)')
-        percentage_pattern = re.compile(r'(\d+)%\s+[Oo]ff')
-        
-        # Split into lines and process
-        lines = self.text_content.split('\n')
-        
-        current_product = {}
-        
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if not line or len(line) < 3:
+        # Dedup happens as products are found: the first occurrence of a
+        # (name, price) pair wins and insertion order is preserved, so no
+        # separate seen-set pass over the full list is needed
+        by_key = {}
+
+        # Stream pages so only one page's text is resident at a time; a
+        # prior extract_text() call is reused when its buffer is present
+        if self.text_content:
+            pages = [self.text_content]
+        else:
+            pages = self.iter_pages_pipelined()
+
+        for page_text in pages:
+            # Cheapest check first: a plain substring test skips the
+            # regex machinery entirely on pages without a single price
+            # (covers, index pages, full-page imagery)
+            if '$' not in page_text:
                 continue
-            
-            # Look for price in the line
-            price_match = price_pattern.search(line)
-            
-            if price_match:
-                # This line likely contains a product with price
-                price = f"${price_match.group(1)}.{price_match.group(2)}"
-                
-                # Extract product name (text before price)
-                product_name = price_pattern.sub('', line).strip()
-                
-                # Clean up common catalogue formatting
-                product_name = re.sub(r'\s+', ' ', product_name)
-                product_name = product_name.strip('•-*→')
-                
-                if product_name and len(product_name) > 3:
-                    product_dict = {
-                        'name': product_name,
-                        'price': price,
-                        'text': line
-                    }
-                    
-                    # Look for save/discount info
-                    save_match = save_pattern.search(line)
-                    if save_match:
-                        product_dict['save'] = f"${save_match.group(1)}"
-                    
-                    percent_match = percentage_pattern.search(line)
-                    if percent_match:
-                        product_dict['discount'] = f"{percent_match.group(1)}%"
-                    
-                    products.append(product_dict)
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_products = []
-        for p in products:
-            key = (p['name'].lower(), p['price'])
-            if key not in seen:
-                seen.add(key)
-                unique_products.append(p)
-        
-        self.products = unique_products
+
+            # One sweep of the price regex over the whole page visits
+            # only the matches instead of every line; the enclosing line
+            # is sliced out around each hit, and later prices on a line
+            # already handled are skipped
+            prev_line_start = -1
+            for price_hit in _PRICE_RE.finditer(page_text):
+                line_start = page_text.rfind('\n', 0, price_hit.start()) + 1
+                if line_start == prev_line_start:
+                    continue
+                prev_line_start = line_start
+                line_end = page_text.find('\n', price_hit.end())
+                if line_end < 0:
+                    line_end = len(page_text)
+                line = page_text[line_start:line_end].strip()
+                if not line or len(line) < 3:
+                    continue
+
+                # One pass over the line collects price, save, and discount
+                # matches together. The save branch consumes its dollar
+                # amount, so a line whose only price sits inside a save
+                # clause ("Save $5.00 when you buy two") deliberately
+                # yields no product — the pre-alternation parser emitted
+                # one with the saving as its price
+                price_match = save_match = percent_match = None
+                for match in _OFFER_RE.finditer(line):
+                    if match.group('dollars') is not None:
+                        price_match = price_match or match
+                    elif match.group('save') is not None:
+                        save_match = save_match or match
+                    else:
+                        percent_match = percent_match or match
+
+                if price_match:
+                    # This line likely contains a product with price
+                    price = f"${price_match.group('dollars')}.{price_match.group('cents')}"
+
+                    # Extract product name (text before price)
+                    product_name = _PRICE_RE.sub('', line).strip()
+
+                    # Clean up common catalogue formatting
+                    product_name = _WS_RE.sub(' ', product_name)
+                    product_name = product_name.strip('•-*→')
+
+                    if product_name and len(product_name) > 3:
+                        product_dict = {
+                            'name': product_name,
+                            'price': price,
+                            'text': line
+                        }
+
+                        # Look for save/discount info
+                        if save_match:
+                            product_dict['save'] = f"${save_match.group('save_amt')}"
+
+                        if percent_match:
+                            product_dict['discount'] = f"{percent_match.group('pct_val')}%"
+
+                        by_key.setdefault(
+                            (product_name.lower(), price), product_dict
+                        )
+
+        self.products = list(by_key.values())
         print(f"  ✓ Found {len(self.products)} products with prices")
         
         return self.products
@@ -205,48 +481,81 @@ class CataloguePDF:
         """
         if not self.products:
             self.parse_products()
-        
-        matches = []
-        
-        for product in self.products:
-            product_text = f"{product['name']} {product.get('text', '')}".lower()
-            
-            for term in watchlist:
-                if term.lower() in product_text:
-                    matches.append(product)
-                    break  # Don't add same product twice
-        
-        return matches
 
+        if not watchlist:
+            return []
+
+        # Lowercase terms once and reuse the compiled matcher across
+        # catalogues scanned with the same watchlist; the haystack for
+        # each product is built and lowered once, not once per term
+        lower_terms = tuple(term.lower() for term in watchlist)
+
+        if AHOCORASICK_AVAILABLE:
+            # One automaton scans each product in a single linear pass
+            # instead of a substring search per watchlist term
+            automaton = build_automaton(lower_terms)
+            return [
+                product
+                for product in self.products
+                if next(
+                    automaton.iter(
+                        f"{product['name']} {product.get('text', '')}".lower()
+                    ),
+                    None,
+                )
+                is not None
+            ]
+
+        # Fallback: a compiled alternation gives the same single-pass scan
+        pattern = build_pattern(lower_terms)
+        return [
+            product
+            for product in self.products
+            if pattern.search(f"{product['name']} {product.get('text', '')}")
+        ]
+
+
+def download_pdf(url: str, save_path: str) -> Optional[str]:
+    """Download a PDF catalogue from URL, hashing it on the way down.
+
+    The SHA-1 is computed over the same chunks that are written to disk,
+    so callers can key the extraction cache without re-reading the file.
 
-def download_pdf(url: str, save_path: str) -> bool:
-    """Download a PDF catalogue from URL.
-    
     Args:
         url: URL of the PDF file
         save_path: Path to save the downloaded PDF
-        
+
     Returns:
-        True if successful, False otherwise
+        Hex SHA-1 digest of the downloaded bytes, or None on failure
     """
     try:
         print(f"Downloading PDF from {url}...")
-        urllib.request.urlretrieve(url, save_path)
+        digest = hashlib.sha1()
+        with urllib.request.urlopen(url) as response, open(save_path, 'wb') as f:
+            while chunk := response.read(1 << 16):
+                f.write(chunk)
+                digest.update(chunk)
         print(f"  ✓ Saved to {save_path}")
-        return True
+        return digest.hexdigest()
     except Exception as e:
         print(f"  ✗ Error downloading PDF: {e}")
-        return False
+        return None
 
 
-def parse_catalogue_pdf(pdf_path: str, watchlist: List[str], verbose: bool = True) -> Dict[str, List[Dict]]:
+def parse_catalogue_pdf(
+    pdf_path: str,
+    watchlist: List[str],
+    verbose: bool = True,
+    force: bool = False,
+) -> Dict[str, List[Dict]]:
     """Main function to parse PDF catalogue and find matches.
-    
+
     Args:
         pdf_path: Path to PDF file
         watchlist: List of product keywords to search for
         verbose: Print detailed progress
-        
+        force: Re-extract even when a cached result exists
+
     Returns:
         Dictionary with parsing results and matches
     """
@@ -267,7 +576,7 @@ def parse_catalogue_pdf(pdf_path: str, watchlist: List[str], verbose: bool = Tru
         catalogue = CataloguePDF(pdf_path)
         
         # Extract and parse
-        catalogue.extract_text()
+        catalogue.extract_text(use_cache=not force)
         catalogue.parse_products()
         
         # Find matches
@@ -304,13 +613,37 @@ def parse_catalogue_pdf(pdf_path: str, watchlist: List[str], verbose: bool = Tru
         return {}
 
 
-def batch_parse_catalogues(pdf_directory: str, watchlist: List[str]) -> Dict[str, List[Dict]]:
+def _process_one_pdf(
+    pdf_path: str, watchlist: List[str], force: bool = False
+) -> Dict[str, List[Dict]]:
+    """Parse one catalogue in a worker process.
+
+    Module-level wrapper so the call is picklable. File-level
+    parallelism already saturates the cores, so page extraction inside
+    each worker stays inline instead of nesting a second pool.
+
+    Args:
+        pdf_path: Path to the PDF file
+        watchlist: List of product keywords to search for
+        force: Re-extract even when a cached result exists
+
+    Returns:
+        Dictionary mapping the filename to matching products
+    """
+    os.environ["PDF_PARSER_THREADS"] = "1"
+    return parse_catalogue_pdf(pdf_path, watchlist, verbose=False, force=force)
+
+
+def batch_parse_catalogues(
+    pdf_directory: str, watchlist: List[str], force: bool = False
+) -> Dict[str, List[Dict]]:
     """Parse multiple PDF catalogues in a directory.
-    
+
     Args:
         pdf_directory: Directory containing PDF catalogues
         watchlist: List of product keywords to search for
-        
+        force: Re-extract even when cached results exist
+
     Returns:
         Dictionary mapping filenames to matching products
     """
@@ -334,18 +667,24 @@ def batch_parse_catalogues(pdf_directory: str, watchlist: List[str]) -> Dict[str
     print(f"Found {len(pdf_files)} PDF files\n")
     
     all_matches = {}
-    
-    for i, pdf_file in enumerate(pdf_files, 1):
-        print(f"\n{'─'*60}")
-        print(f"Processing {i}/{len(pdf_files)}: {pdf_file.name}")
-        print(f"{'─'*60}")
-        
-        results = parse_catalogue_pdf(str(pdf_file), watchlist, verbose=False)
-        
-        if results:
-            all_matches.update(results)
-            matches = list(results.values())[0]
-            print(f"  ✓ Found {len(matches)} matching items")
+
+    # Each file is independent, so catalogues parse across worker
+    # processes; map() returns results in submission order for printing
+    workers = min(_get_max_workers(), len(pdf_files))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results_iter = pool.map(
+            partial(_process_one_pdf, watchlist=watchlist, force=force),
+            (str(pdf_file) for pdf_file in pdf_files),
+        )
+        for i, (pdf_file, results) in enumerate(zip(pdf_files, results_iter), 1):
+            print(f"\n{'─'*60}")
+            print(f"Processed {i}/{len(pdf_files)}: {pdf_file.name}")
+            print(f"{'─'*60}")
+
+            if results:
+                all_matches.update(results)
+                matches = list(results.values())[0]
+                print(f"  ✓ Found {len(matches)} matching items")
     
     # Summary
     print(f"\n{'='*60}")
@@ -404,11 +743,12 @@ def main() -> None:
     print("Works with Coles, Woolworths, and other store PDFs.\n")
     
     # Check if PDF libraries are available
-    if not PDFPLUMBER_AVAILABLE and not PYPDF2_AVAILABLE:
+    if not FITZ_AVAILABLE and not PDFPLUMBER_AVAILABLE and not PYPDF2_AVAILABLE:
         print("❌ No PDF library installed!")
         print("\nInstall one of these:")
+        print("  pip install pymupdf     (fastest)")
         print("  pip install pdfplumber  (recommended)")
-        print("  pip install pypdf2       (alternative)")
+        print("  pip install pypdf2      (alternative)")
         return
     
     # Example watchlist
@@ -422,16 +762,28 @@ def main() -> None:
         "Bread"
     ]
     
+    # Optional: --threads N overrides the extraction worker count
+    if "--threads" in sys.argv:
+        idx = sys.argv.index("--threads")
+        if idx + 1 < len(sys.argv):
+            os.environ["PDF_PARSER_THREADS"] = sys.argv[idx + 1]
+            del sys.argv[idx:idx + 2]
+
+    # Optional: --force bypasses the content-hash text cache
+    force = "--force" in sys.argv
+    if force:
+        sys.argv.remove("--force")
+
     # Check command line arguments
     if len(sys.argv) > 1:
         pdf_path = sys.argv[1]
-        
+
         if os.path.isdir(pdf_path):
             # Batch process directory
-            results = batch_parse_catalogues(pdf_path, watchlist)
+            results = batch_parse_catalogues(pdf_path, watchlist, force=force)
         else:
             # Process single file
-            results = parse_catalogue_pdf(pdf_path, watchlist)
+            results = parse_catalogue_pdf(pdf_path, watchlist, force=force)
         
         if results:
             save_results_to_log(results)
@@ -0,0 +1,73 @@
+"""Tests for the email parser's IMAP protocol helpers."""
+
+import base64
+
+from src.email_parser import (
+    _build_or_query,
+    _decode_transfer_encoding,
+    _find_html_section,
+    _parse_imap_list,
+)
+
+
+def test_or_query_single_address() -> None:
+    """One address needs no OR term."""
+    assert _build_or_query(["a@example.com"]) == 'FROM "a@example.com"'
+
+
+def test_or_query_nests_pairwise() -> None:
+    """IMAP OR is binary, so three addresses nest right-to-left."""
+    query = _build_or_query(["a@x.com", "b@x.com", "c@x.com"])
+
+    assert query == 'OR FROM "a@x.com" OR FROM "b@x.com" FROM "c@x.com"'
+
+
+def test_parse_imap_list_handles_atoms_quotes_and_nesting() -> None:
+    """Quoted strings, bare atoms, and sublists all parse."""
+    items, end = _parse_imap_list('("TEXT" "HTML" ("CHARSET" "UTF-8") NIL 42)')
+
+    assert items == ["TEXT", "HTML", ["CHARSET", "UTF-8"], "NIL", "42"]
+    assert end == len('("TEXT" "HTML" ("CHARSET" "UTF-8") NIL 42)')
+
+
+def test_find_html_section_single_part() -> None:
+    """A non-multipart HTML message is section 1."""
+    parsed, _ = _parse_imap_list(
+        '("TEXT" "HTML" ("CHARSET" "UTF-8") NIL NIL "QUOTED-PRINTABLE" 1024 20)'
+    )
+
+    assert _find_html_section(parsed) == ("1", "quoted-printable", 1024)
+
+
+def test_find_html_section_in_nested_multipart() -> None:
+    """The HTML part of an alternative inside a mixed is section 1.2."""
+    parsed, _ = _parse_imap_list(
+        '((("TEXT" "PLAIN" NIL NIL NIL "7BIT" 10 1)'
+        '("TEXT" "HTML" NIL NIL NIL "BASE64" 2048 30) "ALTERNATIVE")'
+        '("IMAGE" "PNG" NIL NIL NIL "BASE64" 9000) "MIXED")'
+    )
+
+    assert _find_html_section(parsed) == ("1.2", "base64", 2048)
+
+
+def test_find_html_section_missing() -> None:
+    """A text/plain-only message yields no HTML section."""
+    parsed, _ = _parse_imap_list('("TEXT" "PLAIN" NIL NIL NIL "7BIT" 10 1)')
+
+    assert _find_html_section(parsed) is None
+
+
+def test_decode_transfer_encoding_roundtrips() -> None:
+    """base64 and quoted-printable decode; 7bit passes through."""
+    html = b"<p>Tim Tams $3.50</p>"
+
+    assert _decode_transfer_encoding(base64.b64encode(html), "base64") == html
+    assert _decode_transfer_encoding(b"Tim Tams =243.50", "quoted-printable") == (
+        b"Tim Tams $3.50"
+    )
+    assert _decode_transfer_encoding(html, "7bit") == html
+
+
+def test_decode_transfer_encoding_bad_base64_passes_through() -> None:
+    """Payloads that fail to decode come back unchanged."""
+    assert _decode_transfer_encoding(b"not base64!!", "base64") == b"not base64!!"
@@ -0,0 +1,46 @@
+"""Tests for the PDF catalogue parser's product extraction."""
+
+from src.pdf_parser import CataloguePDF
+
+
+def _parse(text: str) -> list:
+    """Parse products from prepared catalogue text."""
+    catalogue = CataloguePDF("unused.pdf")
+    catalogue.text_content = text
+    return catalogue.parse_products()
+
+
+def test_price_save_and_discount_on_one_line() -> None:
+    """A price line carries its save and percent-off annotations."""
+    products = _parse("Tim Tams Chocolate $3.50 Save $1.50 30% Off\n")
+
+    assert len(products) == 1
+    assert products[0]["name"] == "Tim Tams Chocolate Save 30% Off"
+    assert products[0]["price"] == "$3.50"
+    assert products[0]["save"] == "$1.50"
+    assert products[0]["discount"] == "30%"
+
+
+def test_save_only_line_yields_no_product() -> None:
+    """A dollar amount inside a save clause is not a product price.
+
+    Pins the intended behaviour change from the combined offer regex:
+    the save branch consumes "$5.00", so no product is emitted for a
+    line with no standalone price.
+    """
+    assert _parse("Save $5.00 when you buy two\n") == []
+
+
+def test_lines_without_prices_are_skipped() -> None:
+    """Headers and descriptions without a price produce nothing."""
+    assert _parse("WEEKLY SPECIALS\nGreat value this week!\n") == []
+
+
+def test_duplicate_products_collapse_case_insensitively() -> None:
+    """Repeated (name, price) pairs keep only the first occurrence."""
+    products = _parse("Tim Tams $3.50\nTIM TAMS $3.50\nTim Tams $4.00\n")
+
+    assert [(p["name"], p["price"]) for p in products] == [
+        ("Tim Tams", "$3.50"),
+        ("Tim Tams", "$4.00"),
+    ]
@@ -10,15 +10,30 @@ import re
 import smtplib
 import ssl
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
 from email.message import EmailMessage
 from logging.handlers import RotatingFileHandler
+from operator import attrgetter
 from typing import Any
 from urllib.parse import urlsplit, urlunsplit
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+
+# libyaml's C loader parses config files several times faster than the
+# pure-Python SafeLoader and is present in most PyYAML builds.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _load_yaml(stream) -> Any:
+    """Parse YAML with the fastest safe loader available."""
+    return yaml.load(stream, Loader=_YAML_LOADER)
+
 
 """
 Specials checker for Coles & Woolworths via RapidAPI.
@@ -105,7 +120,7 @@ def load_rapidapi_key() -> str:
     secrets_path = os.path.join("config", "secrets.yaml")
     if os.path.exists(secrets_path):
         with open(secrets_path, encoding="utf-8") as f:
-            secrets = yaml.safe_load(f) or {}
+            secrets = _load_yaml(f) or {}
         file_key = secrets.get("rapidapi_key", "")
         if file_key:
             return str(file_key)
@@ -132,7 +147,28 @@ WOOLIES_PRODUCT_SEARCH_URL = f"https://{WOOLIES_HOST}/woolworths/product-search/
 BASE_HEADERS = {
     "X-RapidAPI-Key": RAPIDAPI_KEY,
 }
-SEARCH_RESPONSE_CACHE: dict[tuple[str, str, int, int], dict] = {}
+
+# One pooled session keeps the RapidAPI TLS connections alive across the
+# many search calls in a run instead of paying a handshake per request.
+# No transport-level retries: every HTTP request must map to exactly one
+# _record_api_call so the metered-quota accounting stays honest, and
+# retrying 429 would hammer an endpoint that is asking us to stop.
+_SESSION = requests.Session()
+_SESSION.headers.update(BASE_HEADERS)
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=16),
+)
+# Search responses are memoised per (store, keyword, page) so overlapping
+# keywords across watch items reuse one RapidAPI round-trip. Entries carry
+# the time they were stored and expire after the TTL, which only matters
+# for long-lived processes; a normal run finishes well inside it.
+SEARCH_RESPONSE_CACHE: dict[tuple[str, str, int, int], tuple[float, dict]] = {}
+SEARCH_CACHE_TTL_SECONDS = 3600.0
+
+# Keyword/store searches fan out across this many worker threads so
+# network latency overlaps instead of accumulating per round-trip.
+MAX_CONCURRENT_SEARCHES = 8
 
 API_USAGE_PATH = os.path.join("config", "api_usage.json")
 SPECIALS_FRESHNESS_CONFIG_PATH = os.path.join("config", "specials_freshness.yaml")
@@ -206,7 +242,7 @@ def load_email_config() -> tuple[str | None, dict[str, Any]]:
         return None, {}
 
     with open(email_config_path, encoding="utf-8") as f:
-        cfg = yaml.safe_load(f) or {}
+        cfg = _load_yaml(f) or {}
 
     if not isinstance(cfg, dict):
         raise ValueError(f"{email_config_path} must contain a top-level mapping")
@@ -266,7 +302,7 @@ def load_limit_config() -> dict[str, dict[str, int | None]]:
             continue
 
         with open(path, encoding="utf-8") as f:
-            raw = yaml.safe_load(f) or {}
+            raw = _load_yaml(f) or {}
 
         api_limits = raw.get("api_limits") if isinstance(raw, dict) else None
         if not isinstance(api_limits, dict):
@@ -392,15 +428,21 @@ def _enforce_hard_limit(store: str):
         )
 
 
+# Searches run on worker threads, so usage counting and its state file
+# writes are serialised behind one lock.
+_API_USAGE_LOCK = threading.Lock()
+
+
 def _record_api_call(store: str):
     """Track one API call, enforcing hard limits and persisting state."""
-    _reset_month_if_needed()
-    _enforce_hard_limit(store)
-    API_CALL_COUNT[store] = API_CALL_COUNT.get(store, 0) + 1
-    RUN_API_CALL_COUNT[store] = RUN_API_CALL_COUNT.get(store, 0) + 1
-    API_USAGE_STATE["counts"] = API_CALL_COUNT
-    _save_api_usage_state()
-    _maybe_warn_limit(store)
+    with _API_USAGE_LOCK:
+        _reset_month_if_needed()
+        _enforce_hard_limit(store)
+        API_CALL_COUNT[store] = API_CALL_COUNT.get(store, 0) + 1
+        RUN_API_CALL_COUNT[store] = RUN_API_CALL_COUNT.get(store, 0) + 1
+        API_USAGE_STATE["counts"] = API_CALL_COUNT
+        _save_api_usage_state()
+        _maybe_warn_limit(store)
 
 
 def _normalise_vendor_key(value: object) -> str | None:
@@ -547,7 +589,7 @@ def _load_specials_freshness_config() -> dict[str, Any]:
         return defaults
 
     with open(SPECIALS_FRESHNESS_CONFIG_PATH, encoding="utf-8") as f:
-        raw = yaml.safe_load(f) or {}
+        raw = _load_yaml(f) or {}
 
     if not isinstance(raw, dict):
         return defaults
@@ -1072,7 +1114,7 @@ class Offer:
 def load_watchlist(path: str = "watchlist.yaml") -> list[WatchItem]:
     """Load watch items from YAML into WatchItem objects."""
     with open(path, encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = _load_yaml(f) or {}
 
     raw_items = data.get("items", []) if isinstance(data, dict) else []
     items: list[WatchItem] = []
@@ -1205,10 +1247,12 @@ def select_offers_for_email_recipient(
 
 def rapidapi_get(url: str, host: str, params: dict) -> dict:
     """Perform a RapidAPI GET with required host/key headers."""
-    headers = dict(BASE_HEADERS)
-    headers["X-RapidAPI-Host"] = host
-
-    resp = requests.get(url, headers=headers, params=params, timeout=15)
+    resp = _SESSION.get(
+        url,
+        headers={"X-RapidAPI-Host": host},
+        params=params,
+        timeout=15,
+    )
     resp.raise_for_status()
     return resp.json()
 
@@ -1218,6 +1262,22 @@ def rapidapi_get(url: str, host: str, params: dict) -> dict:
 # =========================
 
 
+def _get_cached_search_response(
+    cache_key: tuple[str, str, int, int],
+) -> dict | None:
+    """Return a cached search response, dropping entries past the TTL."""
+    entry = SEARCH_RESPONSE_CACHE.get(cache_key)
+    if entry is None:
+        return None
+    stored_at, response = entry
+    if time.monotonic() - stored_at > SEARCH_CACHE_TTL_SECONDS:
+        # pop() keeps this safe when search worker threads race on the
+        # same expired entry
+        SEARCH_RESPONSE_CACHE.pop(cache_key, None)
+        return None
+    return response
+
+
 def search_coles(
     keyword: str,
     page_size: int = DEFAULT_PAGE_SIZE,
@@ -1225,7 +1285,7 @@ def search_coles(
 ) -> dict:
     """Search Coles products by keyword."""
     cache_key = ("Coles", keyword.strip().lower(), page_size, page_number)
-    cached = SEARCH_RESPONSE_CACHE.get(cache_key)
+    cached = _get_cached_search_response(cache_key)
     if cached is not None:
         return cached
 
@@ -1236,7 +1296,7 @@ def search_coles(
         "page": max(1, page_number),
     }
     response = rapidapi_get(COLES_PRODUCT_SEARCH_URL, COLES_HOST, params)
-    SEARCH_RESPONSE_CACHE[cache_key] = response
+    SEARCH_RESPONSE_CACHE[cache_key] = (time.monotonic(), response)
     return response
 
 
@@ -1247,7 +1307,7 @@ def search_woolies(
 ) -> dict:
     """Search Woolworths products by keyword."""
     cache_key = ("Woolworths", keyword.strip().lower(), page_size, page_number)
-    cached = SEARCH_RESPONSE_CACHE.get(cache_key)
+    cached = _get_cached_search_response(cache_key)
     if cached is not None:
         return cached
 
@@ -1258,7 +1318,7 @@ def search_woolies(
         "page": max(1, page_number),
     }
     response = rapidapi_get(WOOLIES_PRODUCT_SEARCH_URL, WOOLIES_HOST, params)
-    SEARCH_RESPONSE_CACHE[cache_key] = response
+    SEARCH_RESPONSE_CACHE[cache_key] = (time.monotonic(), response)
     return response
 
 
@@ -1913,40 +1973,59 @@ def collect_offers_by_keyword(
         "Woolworths": (search_woolies, normalise_woolies_product),
     }
 
-    for normalised_keyword, keyword in seen_keywords.items():
+    def _search_one(keyword: str, store: str) -> list[Offer]:
+        """Run one store/keyword search, mapping failures to an empty list."""
+        search_fn, normalise_fn = jobs[store]
+        try:
+            return _collect_keyword_offers(
+                WatchItem(
+                    name=keyword,
+                    match_keywords=[keyword],
+                    include_keywords=[keyword],
+                    exclude_keywords=[],
+                    stores=[store],
+                    include_unknown_half_price=True,
+                    only_half_price=False,
+                    price_range=None,
+                    size_range=None,
+                ),
+                keyword,
+                store,
+                search_fn,
+                normalise_fn,
+            )
+        except APILimitExceeded:
+            FAILED_VENDOR_QUERIES.add(store)
+            print(f"[WARN] {store} API limit reached for '{keyword}'")
+        except Exception as exc:
+            FAILED_VENDOR_QUERIES.add(store)
+            print(f"[WARN] {store} search failed for '{keyword}': {exc}")
+        return []
+
+    # Each store/keyword pair is independent, so the searches fan out
+    # across a bounded thread pool and their network latency overlaps.
+    # Results are reassembled in keyword order afterwards so output and
+    # dedupe behaviour match the previous sequential loop.
+    tasks = [
+        (normalised_keyword, keyword, store)
+        for normalised_keyword, keyword in seen_keywords.items()
+        for store in ("Coles", "Woolworths")
+        if store in keyword_stores.get(normalised_keyword, set())
+    ]
+    task_offers: dict[tuple[str, str], list[Offer]] = {}
+    if tasks:
+        max_workers = min(MAX_CONCURRENT_SEARCHES, len(tasks))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                (normalised_keyword, store): pool.submit(_search_one, keyword, store)
+                for normalised_keyword, keyword, store in tasks
+            }
+            task_offers = {key: future.result() for key, future in futures.items()}
+
+    for normalised_keyword in seen_keywords:
         keyword_offers: list[Offer] = []
         for store in ("Coles", "Woolworths"):
-            if store not in keyword_stores.get(normalised_keyword, set()):
-                continue
-            search_fn, normalise_fn = jobs[store]
-            try:
-                keyword_offers.extend(
-                    _collect_keyword_offers(
-                        WatchItem(
-                            name=keyword,
-                            match_keywords=[keyword],
-                            include_keywords=[keyword],
-                            exclude_keywords=[],
-                            stores=[store],
-                            include_unknown_half_price=True,
-                            only_half_price=False,
-                            price_range=None,
-                            size_range=None,
-                        ),
-                        keyword,
-                        store,
-                        search_fn,
-                        normalise_fn,
-                    )
-                )
-            except APILimitExceeded:
-                FAILED_VENDOR_QUERIES.add(store)
-                print(f"[WARN] {store} API limit reached for '{keyword}'")
-                continue
-            except Exception as exc:
-                FAILED_VENDOR_QUERIES.add(store)
-                print(f"[WARN] {store} search failed for '{keyword}': {exc}")
-
+            keyword_offers.extend(task_offers.get((normalised_keyword, store), []))
         offers_by_keyword[normalised_keyword] = _dedupe_offers(keyword_offers)
 
     return offers_by_keyword
@@ -2051,7 +2130,7 @@ def _build_cheapest_summary(
     """Return per-watch cheapest offer plus freshness-aware advisory notes."""
     summary: dict[str, dict[str, Any]] = {}
     for watch_name, offers in all_offers.items():
-        sorted_offers = sorted(offers, key=lambda offer: (offer.price, offer.store))
+        sorted_offers = sorted(offers, key=_OFFER_CHEAPEST_KEY)
         cheapest = sorted_offers[0] if sorted_offers else None
         available_stores = {offer.store for offer in sorted_offers}
         expected_stores = (
@@ -2147,6 +2226,24 @@ def _build_html_cheapest_section(
     return parts
 
 
+# Sort keys built once with attrgetter so large offer lists sort via a
+# C-level key function instead of a Python lambda per element.
+_OFFER_DISPLAY_KEY = attrgetter("store", "price")
+_OFFER_PRICE_KEY = attrgetter("price")
+_OFFER_CHEAPEST_KEY = attrgetter("price", "store")
+
+
+def _sorted_offers_and_cheapest(offers: list[Offer]) -> tuple[list[Offer], Offer]:
+    """Return offers in display order plus the cheapest, in one place.
+
+    Both report builders need the same (store, price) ordering and the
+    same cheapest offer, so the sorting logic lives here once.
+    """
+    offers_sorted = sorted(offers, key=_OFFER_DISPLAY_KEY)
+    watch_cheapest = min(offers_sorted, key=_OFFER_PRICE_KEY)
+    return offers_sorted, watch_cheapest
+
+
 def build_report(
     all_offers: dict[str, list[Offer]],
     limit_warnings: list[str] | None = None,
@@ -2176,9 +2273,7 @@ def build_report(
             lines.append("No matching products or specials found.\n")
             continue
 
-        offers_sorted = sorted(offers, key=lambda offer: (offer.store, offer.price))
-
-        watch_cheapest = min(offers_sorted, key=lambda offer: offer.price)
+        offers_sorted, watch_cheapest = _sorted_offers_and_cheapest(offers)
 
         for offer in offers_sorted:
             was_str = f" (was ${offer.was_price:.2f})" if offer.was_price else ""
@@ -2241,8 +2336,7 @@ def build_html_report(
             parts.append("<p>No matching products or specials found.</p>")
             continue
 
-        offers_sorted = sorted(offers, key=lambda offer: (offer.store, offer.price))
-        watch_cheapest = min(offers_sorted, key=lambda offer: offer.price)
+        offers_sorted, watch_cheapest = _sorted_offers_and_cheapest(offers)
 
         headers = ["Store", "Product", "Brand", "Price", "Size", "Link"]
         if verbose: